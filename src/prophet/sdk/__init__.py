@@ -24,11 +24,10 @@ Example:
         print(deployment.name)
 """
 
-from .client import HealthStatus, Prophet
-from .collector import CollectorAPI
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Deployment submodule exports
-from .deployments import Deployment, DeploymentsAPI
+from .client import HealthStatus, Prophet
 from .exceptions import (
     APIError,
     AuthenticationError,
@@ -40,27 +39,6 @@ from .exceptions import (
     TokenExpiredError,
     ValidationError,
 )
-from .factory import FactoryAPI, Installer
-
-# Flow submodule exports
-from .flows import (
-    BeaconData,
-    DirectionFields,
-    Flow,
-    FlowIterator,
-    FlowPage,
-    FlowsAPI,
-    GeoEntry,
-    Meta,
-    QualityMetrics,
-    RateMetrics,
-    SessionMetrics,
-    SimpleMetrics,
-    Threat,
-    TimingMetrics,
-    Transport,
-    VolumeMetrics,
-)
 from .models import (
     At,
     DaysAgo,
@@ -71,75 +49,202 @@ from .models import (
     TimeFilter,
     WeeksAgo,
 )
+from .query import Q
 
-# Investigations submodule exports
-from .investigations import (
-    AtAGlance,
-    AttackRef,
-    DecisionSupport,
-    HostValue,
-    Investigation,
-    InvestigationListItem,
-    InvestigationMeta,
-    InvestigationPage,
-    InvestigationsAPI,
-    KeyFinding,
-    OpenQuestion,
-    Provenance,
-    ProvenanceActor,
-    ProvenanceLeg,
-    RecommendedAction,
-    TimelineEvent,
-    TrafficLink,
-    Trigger,
-    TriggerSignal,
-    Verdict,
-)
+if TYPE_CHECKING:
+    from .collector import CollectorAPI
+    from .deployments import (
+        Deployment,
+        DeploymentsAPI,
+    )
+    from .explore import (
+        Access,
+        Beacon,
+        Cadence,
+        CdfPoint,
+        Coverage,
+        EgressAPI,
+        ExploreAPI,
+        MatrixCell,
+        OrganizationHeader,
+        OrganizationList,
+        OrganizationRow,
+        ProcessRow,
+        Reach,
+        SourceRow,
+        Temporal,
+        TermRow,
+        Transfer,
+        TransferFacts,
+    )
+    from .factory import (
+        FactoryAPI,
+        Installer,
+    )
+    from .flows import (
+        AsyncFlowIterator,
+        BeaconData,
+        DirectionFields,
+        Flow,
+        FlowColumns,
+        FlowIterator,
+        FlowList,
+        FlowPage,
+        FlowsAPI,
+        GeoEntry,
+        Meta,
+        QualityMetrics,
+        RateMetrics,
+        SessionMetrics,
+        SimpleMetrics,
+        Threat,
+        TimingMetrics,
+        Transport,
+        VolumeMetrics,
+    )
+    from .investigations import (
+        AtAGlance,
+        AttackRef,
+        DecisionSupport,
+        HostValue,
+        Investigation,
+        InvestigationListItem,
+        InvestigationMeta,
+        InvestigationPage,
+        InvestigationsAPI,
+        KeyFinding,
+        OpenQuestion,
+        Provenance,
+        ProvenanceActor,
+        ProvenanceLeg,
+        RecommendedAction,
+        TimelineEvent,
+        TrafficLink,
+        Trigger,
+        TriggerSignal,
+        Verdict,
+    )
+    from .nodes import (
+        Node,
+        NodeConnection,
+        NodeHealth,
+        NodesAPI,
+        ProvisionedUnit,
+        derive_machine_id,
+    )
+    from .profiles import (
+        EnabledService,
+        HostLogServices,
+        NetflowServices,
+        PacketServices,
+        Profile,
+        ProfilesAPI,
+        ProfileServices,
+        lightweight_packet_services,
+    )
 
-# Explore submodule exports
-from .explore import (
-    Access,
-    Beacon,
-    Cadence,
-    CdfPoint,
-    Coverage,
-    EgressAPI,
-    ExploreAPI,
-    MatrixCell,
-    OrganizationHeader,
-    OrganizationList,
-    OrganizationRow,
-    ProcessRow,
-    Reach,
-    SourceRow,
-    Temporal,
-    TermRow,
-    Transfer,
-    TransferFacts,
-)
+# Submodule exports resolved on first attribute access (PEP 562), so that
+# `import prophet.sdk` doesn't load every namespace's model graph up front.
+_LAZY: dict[str, str] = {
+    "CollectorAPI": "collector",
+    "Deployment": "deployments",
+    "DeploymentsAPI": "deployments",
+    "Access": "explore",
+    "Beacon": "explore",
+    "Cadence": "explore",
+    "CdfPoint": "explore",
+    "Coverage": "explore",
+    "EgressAPI": "explore",
+    "ExploreAPI": "explore",
+    "MatrixCell": "explore",
+    "OrganizationHeader": "explore",
+    "OrganizationList": "explore",
+    "OrganizationRow": "explore",
+    "ProcessRow": "explore",
+    "Reach": "explore",
+    "SourceRow": "explore",
+    "Temporal": "explore",
+    "TermRow": "explore",
+    "Transfer": "explore",
+    "TransferFacts": "explore",
+    "FactoryAPI": "factory",
+    "Installer": "factory",
+    "AsyncFlowIterator": "flows",
+    "BeaconData": "flows",
+    "DirectionFields": "flows",
+    "Flow": "flows",
+    "FlowColumns": "flows",
+    "FlowIterator": "flows",
+    "FlowList": "flows",
+    "FlowPage": "flows",
+    "FlowsAPI": "flows",
+    "GeoEntry": "flows",
+    "Meta": "flows",
+    "QualityMetrics": "flows",
+    "RateMetrics": "flows",
+    "SessionMetrics": "flows",
+    "SimpleMetrics": "flows",
+    "Threat": "flows",
+    "TimingMetrics": "flows",
+    "Transport": "flows",
+    "VolumeMetrics": "flows",
+    "AtAGlance": "investigations",
+    "AttackRef": "investigations",
+    "DecisionSupport": "investigations",
+    "HostValue": "investigations",
+    "Investigation": "investigations",
+    "InvestigationListItem": "investigations",
+    "InvestigationMeta": "investigations",
+    "InvestigationPage": "investigations",
+    "InvestigationsAPI": "investigations",
+    "KeyFinding": "investigations",
+    "OpenQuestion": "investigations",
+    "Provenance": "investigations",
+    "ProvenanceActor": "investigations",
+    "ProvenanceLeg": "investigations",
+    "RecommendedAction": "investigations",
+    "TimelineEvent": "investigations",
+    "TrafficLink": "investigations",
+    "Trigger": "investigations",
+    "TriggerSignal": "investigations",
+    "Verdict": "investigations",
+    "Node": "nodes",
+    "NodeConnection": "nodes",
+    "NodeHealth": "nodes",
+    "NodesAPI": "nodes",
+    "ProvisionedUnit": "nodes",
+    "derive_machine_id": "nodes",
+    "EnabledService": "profiles",
+    "HostLogServices": "profiles",
+    "NetflowServices": "profiles",
+    "PacketServices": "profiles",
+    "Profile": "profiles",
+    "ProfilesAPI": "profiles",
+    "ProfileServices": "profiles",
+    "lightweight_packet_services": "profiles",
+}
 
-# Nodes submodule exports
-from .nodes import (
-    Node,
-    NodeConnection,
-    NodeHealth,
-    NodesAPI,
-    ProvisionedUnit,
-    derive_machine_id,
-)
 
-# Profiles submodule exports
-from .profiles import (
-    EnabledService,
-    HostLogServices,
-    NetflowServices,
-    PacketServices,
-    Profile,
-    ProfilesAPI,
-    ProfileServices,
-    lightweight_packet_services,
-)
-from .query import Q
+# The namespace subpackages themselves, which used to be bound as attributes by
+# the eager imports (`prophet.sdk.flows`, `prophet.sdk.deployments`, ...).
+_SUBPACKAGES = frozenset(_LAZY.values())
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBPACKAGES:
+        # import_module binds the subpackage on this module as a side effect
+        return importlib.import_module(f".{name}", __name__)
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY) | _SUBPACKAGES)
+
 
 __version__ = "0.5.0"
 
@@ -163,7 +268,10 @@ __all__ = [
     "FlowsAPI",
     "Flow",
     "FlowPage",
+    "FlowList",
+    "FlowColumns",
     "FlowIterator",
+    "AsyncFlowIterator",
     "DirectionFields",
     "Transport",
     "Meta",
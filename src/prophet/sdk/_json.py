@@ -0,0 +1,21 @@
+"""JSON encode/decode for the request and response bodies the SDK builds itself.
+
+Flow pages are decoded by pydantic-core (see FlowPage.from_json); this covers the
+small remainder - token exchange, health and the search request prefix - with the
+stdlib, encoding compactly straight to bytes.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document from bytes or text."""
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode a JSON document to compact UTF-8 bytes."""
+    return json.dumps(obj, separators=(",", ":")).encode()
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from typing import TYPE_CHECKING
 
 import requests
 
+from . import _json
 from .exceptions import AuthenticationError
 
 if TYPE_CHECKING:
@@ -17,7 +19,12 @@ logger = logging.getLogger("prophet.sdk")
 
 
 class TokenManager:
-    """Handles OAuth2 token lifecycle with automatic refresh."""
+    """
+    Handles OAuth2 token lifecycle with automatic refresh.
+
+    Thread-safe: iterators and threads sharing one client share one token, and
+    concurrent callers near expiry trigger a single refresh rather than one each.
+    """
 
     def __init__(
         self,
@@ -38,12 +45,19 @@ class TokenManager:
             refresh_threshold: Seconds before expiry to trigger refresh (default: 300)
         """
         self._base_url = base_url.rstrip("/")
+        self._token_url = f"{self._base_url}/rest/oauth2/token/1.0"
         self._client_id = client_id
         self._client_secret = client_secret
         self._session = session or requests.Session()
         self._refresh_threshold = refresh_threshold
         self._token: str | None = None
+        self._auth_header: str | None = None
         self._expires_at: float | None = None
+        # Monotonic deadline after which get_token() refreshes. Kept separately
+        # from the wall-clock expires_at so the per-request check is a single
+        # compare that is immune to system clock jumps.
+        self._refresh_at = 0.0
+        self._lock = threading.Lock()
 
     def get_token(self) -> str:
         """
@@ -55,10 +69,28 @@ class TokenManager:
         Raises:
             AuthenticationError: If token acquisition fails
         """
-        if self._needs_refresh():
-            self._fetch_token()
-        assert self._token is not None
-        return self._token
+        token = self._token
+        if token is not None and time.monotonic() < self._refresh_at:
+            return token
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock.
+            if self._needs_refresh():
+                self._fetch_token()
+            assert self._token is not None
+            return self._token
+
+    def auth_header(self) -> str:
+        """
+        `Authorization` header value for a valid token, refreshing if necessary.
+
+        Built once per token rather than formatted on every request.
+        """
+        header = self._auth_header
+        if header is not None and time.monotonic() < self._refresh_at:
+            return header
+        self.get_token()
+        assert self._auth_header is not None
+        return self._auth_header
 
     def refresh(self) -> str:
         """
@@ -70,9 +102,10 @@ class TokenManager:
         Raises:
             AuthenticationError: If refresh fails
         """
-        self._fetch_token()
-        assert self._token is not None
-        return self._token
+        with self._lock:
+            self._fetch_token()
+            assert self._token is not None
+            return self._token
 
     def is_expired(self) -> bool:
         """Check if current token is expired."""
@@ -84,24 +117,31 @@ class TokenManager:
         """Check if token should be refreshed (within threshold of expiry)."""
         if self._token is None or self._expires_at is None:
             return True
-        return time.time() >= (self._expires_at - self._refresh_threshold)
+        return time.monotonic() >= self._refresh_at
 
     def _fetch_token(self) -> None:
         """Fetch a new token from the OAuth2 endpoint."""
         logger.debug("refreshing access token")
-        url = f"{self._base_url}/rest/oauth2/token/1.0"
         payload = {
             "client_id": self._client_id,
             "client_secret": self._client_secret,
         }
 
         try:
-            response = self._session.post(url, json=payload, timeout=30)
+            response = self._session.post(
+                self._token_url,
+                data=_json.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=30,
+            )
         except requests.RequestException as e:
             raise AuthenticationError(f"Failed to connect to auth server: {e}") from e
 
         if response.status_code == 401:
-            data = response.json()
+            try:
+                data = _json.loads(response.content)
+            except ValueError:  # non-JSON body (e.g. from a proxy)
+                data = {}
             raise AuthenticationError(
                 message=data.get("error", "Invalid credentials"),
                 code=data.get("code", "invalid_credentials"),
@@ -115,11 +155,19 @@ class TokenManager:
                 details={"status_code": response.status_code, "body": response.text},
             )
 
-        data = response.json()
-        self._token = data["access_token"]
-        self._expires_at = float(data["expires_at"])
+        data = _json.loads(response.content)
+        token = data["access_token"]
+        expires_at = float(data["expires_at"])
+        self._token = token
+        self._auth_header = f"Bearer {token}"
+        self._expires_at = expires_at
+        # Published last: the lock-free fast paths trust the token once this is set.
+        self._refresh_at = time.monotonic() + (expires_at - time.time()) - self._refresh_threshold
 
     def clear(self) -> None:
         """Clear cached token, forcing refresh on next access."""
-        self._token = None
-        self._expires_at = None
+        with self._lock:
+            self._refresh_at = 0.0
+            self._token = None
+            self._auth_header = None
+            self._expires_at = None
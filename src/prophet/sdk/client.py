@@ -5,26 +5,36 @@ from __future__ import annotations
 import base64
 import json
 import logging
+import threading
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from . import _json
 from .auth import TokenManager
-from .collector import CollectorAPI
-from .deployments import DeploymentsAPI
 from .exceptions import APIError, AuthenticationError, ConnectionError
-from .explore import ExploreAPI
-from .factory import FactoryAPI
-from .flows import FlowsAPI
-from .investigations import InvestigationsAPI
-from .nodes import NodesAPI
-from .profiles import ProfilesAPI
+
+if TYPE_CHECKING:
+    from .collector import CollectorAPI
+    from .deployments import DeploymentsAPI
+    from .explore import ExploreAPI
+    from .factory import FactoryAPI
+    from .flows import FlowsAPI
+    from .investigations import InvestigationsAPI
+    from .nodes import NodesAPI
+    from .profiles import ProfilesAPI
 
 logger = logging.getLogger("prophet.sdk")
 
+# Connection pool sizing. Pagination and concurrent callers sharing one client
+# reuse warm keep-alive connections instead of re-handshaking TLS when requests's
+# default 10-slot pool evicts them.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+
 
 def _jwt_aud(token: str) -> str:
     """Decode the `aud` claim from a JWT payload without verifying the signature."""
@@ -39,7 +49,48 @@ def _jwt_aud(token: str) -> str:
     return aud
 
 
-@dataclass
+def _new_session(max_retries: int) -> requests.Session:
+    """Build a pooled session with JSON content type and idempotent-only retries."""
+    session = requests.Session()
+    # Every API body is JSON; set it once rather than per request. The bearer
+    # token is added by _request() so unauthenticated calls (health) stay so.
+    session.headers["Content-Type"] = "application/json"
+
+    # Retry transient failures on idempotent methods only (urllib3's default
+    # allowed_methods excludes POST), so reads self-heal across blips but a
+    # provision POST is never silently retried.
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        pool_block=False,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@dataclass(slots=True)
+class _SharedTransport:
+    """A session + token manager shared by clients created with share_session=True."""
+
+    session: requests.Session
+    auth: TokenManager
+    refs: int = 0
+
+
+# Keyed by (base_url, client_id, client_secret).
+_SHARED: dict[tuple[str, str, str], _SharedTransport] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
 class HealthStatus:
     """API health check response."""
 
@@ -99,6 +150,7 @@ class Prophet:
         timeout: float = 30.0,
         refresh_threshold: int = 300,
         max_retries: int = 3,
+        share_session: bool = False,
     ) -> None:
         """
         Initialize the Prophet client.
@@ -112,41 +164,56 @@ class Prophet:
             max_retries: Retries for transient failures (429/5xx) on idempotent
                 requests, with exponential backoff (default: 3). POST is not
                 auto-retried, so provisioning never double-mints a credential.
+            share_session: Reuse one process-wide HTTP session and access token
+                for every client built with the same base_url and credentials,
+                so constructing a client per request (notebooks, serverless
+                handlers) skips the TLS handshake and OAuth round-trip. The
+                first such client's max_retries/refresh_threshold apply; the
+                session is closed when the last sharing client is closed.
         """
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
-        self._session = requests.Session()
-
-        # Retry transient failures on idempotent methods only (urllib3's default
-        # allowed_methods excludes POST), so reads self-heal across blips but a
-        # provision POST is never silently retried.
-        retry = Retry(
-            total=max_retries,
-            backoff_factor=0.5,
-            status_forcelist=(429, 500, 502, 503, 504),
-            raise_on_status=False,
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        self._session.mount("https://", adapter)
-        self._session.mount("http://", adapter)
-
-        self._auth = TokenManager(
-            base_url=self._base_url,
-            client_id=client_id,
-            client_secret=client_secret,
-            session=self._session,
-            refresh_threshold=refresh_threshold,
-        )
+        self._share_session = share_session
+        self._shared_key: tuple[str, str, str] | None = None
+
+        if share_session:
+            key = (self._base_url, client_id, client_secret)
+            with _SHARED_LOCK:
+                shared = _SHARED.get(key)
+                if shared is None:
+                    session = _new_session(max_retries)
+                    auth = TokenManager(
+                        base_url=self._base_url,
+                        client_id=client_id,
+                        client_secret=client_secret,
+                        session=session,
+                        refresh_threshold=refresh_threshold,
+                    )
+                    shared = _SHARED[key] = _SharedTransport(session, auth)
+                shared.refs += 1
+            self._shared_key = key
+            self._session = shared.session
+            self._auth = shared.auth
+        else:
+            self._session = _new_session(max_retries)
+            self._auth = TokenManager(
+                base_url=self._base_url,
+                client_id=client_id,
+                client_secret=client_secret,
+                session=self._session,
+                refresh_threshold=refresh_threshold,
+            )
 
-        # Initialize API namespaces
-        self._flows = FlowsAPI(self)
-        self._investigations = InvestigationsAPI(self)
-        self._explore = ExploreAPI(self)
-        self._deployments = DeploymentsAPI(self)
-        self._nodes = NodesAPI(self)
-        self._profiles = ProfilesAPI(self)
-        self._collector = CollectorAPI(self)
-        self._factory = FactoryAPI(self)
+        # API namespaces are built (and their modules imported) on first access,
+        # so a script that only touches one namespace never loads the others.
+        self._flows: FlowsAPI | None = None
+        self._investigations: InvestigationsAPI | None = None
+        self._explore: ExploreAPI | None = None
+        self._deployments: DeploymentsAPI | None = None
+        self._nodes: NodesAPI | None = None
+        self._profiles: ProfilesAPI | None = None
+        self._collector: CollectorAPI | None = None
+        self._factory: FactoryAPI | None = None
 
     @property
     def flows(self) -> FlowsAPI:
@@ -165,6 +232,10 @@ class Prophet:
             for flow in prophet.flows("inst-1", Q("dst.port").eq(443)):
                 print(flow.src.ip)
         """
+        if self._flows is None:
+            from .flows import FlowsAPI
+
+            self._flows = FlowsAPI(self)
         return self._flows
 
     @property
@@ -185,6 +256,10 @@ class Prophet:
             if full and full.needs_escalation:
                 print(full.at_a_glance.therefore)
         """
+        if self._investigations is None:
+            from .investigations import InvestigationsAPI
+
+            self._investigations = InvestigationsAPI(self)
         return self._investigations
 
     @property
@@ -203,6 +278,10 @@ class Prophet:
             # Create a sub-deployment
             child = prophet.deployments.create(name="Sub Tenant", handle="sub_tenant")
         """
+        if self._deployments is None:
+            from .deployments import DeploymentsAPI
+
+            self._deployments = DeploymentsAPI(self)
         return self._deployments
 
     @property
@@ -221,6 +300,10 @@ class Prophet:
             )
             yaml_blob = unit.collector_yaml(spool_dir="/data/apps/prophet/spool")
         """
+        if self._nodes is None:
+            from .nodes import NodesAPI
+
+            self._nodes = NodesAPI(self)
         return self._nodes
 
     @property
@@ -234,6 +317,10 @@ class Prophet:
         Example:
             profile = prophet.profiles.create(name="Fleet A")
         """
+        if self._profiles is None:
+            from .profiles import ProfilesAPI
+
+            self._profiles = ProfilesAPI(self)
         return self._profiles
 
     @property
@@ -247,6 +334,10 @@ class Prophet:
         Example:
             binary = prophet.collector.download(arch="arm7", extract=True, dest="./dist")
         """
+        if self._collector is None:
+            from .collector import CollectorAPI
+
+            self._collector = CollectorAPI(self)
         return self._collector
 
     @property
@@ -263,6 +354,10 @@ class Prophet:
                 profile_id="<uuid>", serial="SN-0042", arch="arm7",
             )
         """
+        if self._factory is None:
+            from .factory import FactoryAPI
+
+            self._factory = FactoryAPI(self)
         return self._factory
 
     @property
@@ -278,6 +373,10 @@ class Prophet:
             for o in orgs.organizations:
                 print(o.name, o.upload, o.download)
         """
+        if self._explore is None:
+            from .explore import ExploreAPI
+
+            self._explore = ExploreAPI(self)
         return self._explore
 
     @property
@@ -315,7 +414,7 @@ class Prophet:
                 status_code=response.status_code,
             )
 
-        data = response.json()
+        data = _json.loads(response.content)
         return HealthStatus(
             status=data.get("status", "unknown"),
             service=data.get("service", ""),
@@ -343,13 +442,11 @@ class Prophet:
         url = f"{self._base_url}{path}"
         logger.debug("%s %s", method, path)
 
-        # Get fresh token
-        token = self._auth.get_token()
-
-        # Set headers
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {token}"
-        headers["Content-Type"] = "application/json"
+        # `json=` bodies are left to requests (stdlib json, so any value json.dumps
+        # accepts still goes through); the hot search body arrives pre-encoded
+        # as `data=` bytes. Caller headers are copied, never modified in place.
+        headers = dict(kwargs.pop("headers", None) or ())
+        headers["Authorization"] = self._auth.auth_header()
 
         # Set timeout if not specified
         if "timeout" not in kwargs:
@@ -361,8 +458,19 @@ class Prophet:
             raise ConnectionError(f"Request failed: {e}") from e
 
     def close(self) -> None:
-        """Close the HTTP session."""
-        self._session.close()
+        """Close the HTTP session (or release this client's hold on a shared one)."""
+        if not self._share_session:
+            self._session.close()
+            return
+        if self._shared_key is None:  # already released
+            return
+        key, self._shared_key = self._shared_key, None
+        with _SHARED_LOCK:
+            shared = _SHARED[key]
+            shared.refs -= 1
+            if shared.refs == 0:
+                del _SHARED[key]
+                shared.session.close()
 
     def __enter__(self) -> Prophet:
         return self
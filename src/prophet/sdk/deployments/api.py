@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import time
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
 
 from ..exceptions import APIError, ValidationError, raise_for_response
-from .models import Deployment
+from .models import Deployment, _CreateResponse, _DeploymentList
+
+_M = TypeVar("_M", bound=BaseModel)
+
+# How long get()/get_many() may answer from the last list() of a parent, in seconds.
+_LIST_CACHE_TTL = 30.0
+# Parents whose last list() is kept; the least recently used is evicted beyond this.
+_LIST_CACHE_SIZE = 32
 
 if TYPE_CHECKING:
     from ..client import Prophet
@@ -24,10 +36,20 @@ class DeploymentsAPI:
 
         child = prophet.deployments.create(name="ACME Corp", handle="acme")
         prophet.deployments.delete(child.customer_id)
+
+        found = prophet.deployments.get_many(["child-1", "child-2"])  # one request
+
+    get() and get_many() answer from the last list() of the same parent for up
+    to 30 seconds; create() and delete() drop that cache, and
+    invalidate_cache() does so explicitly. list() itself always hits the API.
     """
 
     def __init__(self, client: Prophet) -> None:
         self._client = client
+        # parent_id (None = authenticated tenant) -> (monotonic time, deployments),
+        # in least- to most-recently-used order. Stored as a tuple so that
+        # callers mutating what list() returned can't change later lookups.
+        self._list_cache: dict[str | None, tuple[float, tuple[Deployment, ...]]] = {}
 
     def list(self, parent_id: str | None = None) -> list[Deployment]:
         """
@@ -43,8 +65,13 @@ class DeploymentsAPI:
         response = self._client._request("GET", "/rest/deployments/1.0", params=params)
         raise_for_response(response)
 
-        data = self._json(response)
-        return [Deployment.model_validate(d) for d in data.get("deployments", [])]
+        deployments = self._parse(_DeploymentList, response).deployments
+        cache = self._list_cache
+        cache.pop(parent_id, None)
+        cache[parent_id] = (time.monotonic(), tuple(deployments))
+        if len(cache) > _LIST_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        return deployments
 
     def create(self, name: str, handle: str, parent_id: str | None = None) -> Deployment:
         """
@@ -69,8 +96,8 @@ class DeploymentsAPI:
         raise_for_response(response)
 
         # Response shape: {deployment: {customer: {...}, org: {...}}}
-        customer = self._json(response).get("deployment", {}).get("customer", {})
-        return Deployment.model_validate(customer)
+        self.invalidate_cache()
+        return self._parse(_CreateResponse, response).deployment.customer
 
     def delete(self, customer_id: str, parent_id: str | None = None) -> None:
         """Delete a sub-deployment (cascades deletion of its nodes and credentials)."""
@@ -80,27 +107,60 @@ class DeploymentsAPI:
         parent = parent_id or self._client.customer_id
         payload = {"customer_id": customer_id, "parent_id": parent}
         response = self._client._request("DELETE", "/rest/deployments/1.0", json=payload)
+        self.invalidate_cache()
         raise_for_response(response)
 
     def get(self, customer_id: str, parent_id: str | None = None) -> Deployment | None:
         """Get a sub-deployment by customer_id, or None if not found."""
-        for deployment in self.list(parent_id):
+        for deployment in self._recent_list(parent_id):
             if deployment.customer_id == customer_id:
                 return deployment
         return None
 
+    def get_many(
+        self, customer_ids: Iterable[str], parent_id: str | None = None
+    ) -> dict[str, Deployment | None]:
+        """
+        Look up several sub-deployments with a single list request.
+
+        Prefer this over calling get() in a loop, which lists every deployment
+        once per lookup.
+
+        Returns:
+            dict mapping each requested customer_id to its Deployment, or None
+            if not found.
+        """
+        wanted = dict.fromkeys(customer_ids)
+        if not wanted:
+            return {}
+        by_id = {d.customer_id: d for d in self._recent_list(parent_id)}
+        return {cid: by_id.get(cid) for cid in wanted}
+
+    def invalidate_cache(self) -> None:
+        """Forget cached list() results so the next get() re-reads from the API."""
+        self._list_cache.clear()
+
+    def _recent_list(self, parent_id: str | None) -> Sequence[Deployment]:
+        cached = self._list_cache.pop(parent_id, None)
+        if cached is not None and time.monotonic() - cached[0] < _LIST_CACHE_TTL:
+            self._list_cache[parent_id] = cached  # mark most recently used
+            return cached[1]
+        return self.list(parent_id)
+
     @staticmethod
-    def _json(response: Any) -> dict[str, Any]:
-        if not response.text:
+    def _parse(model: type[_M], response: Any) -> _M:
+        """Parse and validate the body in one pydantic-core pass over the raw bytes."""
+        if not response.content:
             raise APIError(
                 f"Empty response from API (status={response.status_code})",
                 status_code=response.status_code,
             )
         try:
-            data: dict[str, Any] = response.json()
-        except Exception:
+            return model.model_validate_json(response.content)
+        except PydanticValidationError as e:
+            if e.errors()[0]["type"] != "json_invalid":
+                raise
             raise APIError(
                 f"Invalid JSON response: {response.text[:500]}",
                 status_code=response.status_code,
             ) from None
-        return data
@@ -27,3 +27,25 @@ class Deployment(BaseModel):
 
     def __repr__(self) -> str:
         return f"Deployment({self.customer_id}, name={self.name!r}, parent={self.parent})"
+
+
+class _DeploymentList(BaseModel):
+    """`GET /rest/deployments/1.0` envelope: {parent, deployments, count}."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    deployments: list[Deployment] = []
+
+
+class _CreatedDeployment(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    customer: Deployment
+
+
+class _CreateResponse(BaseModel):
+    """`POST /rest/deployments/1.0` envelope: {deployment: {customer, org}}."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    deployment: _CreatedDeployment
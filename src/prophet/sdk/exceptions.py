@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
 from typing import Any
 
 
@@ -118,16 +119,70 @@ def parse_error(data: Any, fallback: str) -> tuple[str, str | None, dict[str, An
     return message, data.get("code"), None
 
 
-def raise_for_response(response: Any) -> None:
+# Builds the exception for one status: (status, message, kind, details) -> error.
+ErrorFactory = Callable[[int, str, "str | None", "dict[str, Any] | None"], ProphetError]
+
+
+def _authentication_error(
+    status: int, message: str, kind: str | None, details: dict[str, Any] | None
+) -> ProphetError:
+    return AuthenticationError(message=message, code=kind, details=details)
+
+
+def _validation_error(
+    status: int, message: str, kind: str | None, details: dict[str, Any] | None
+) -> ProphetError:
+    return ValidationError(message=message, details=details)
+
+
+def _authorization_error(
+    status: int, message: str, kind: str | None, details: dict[str, Any] | None
+) -> ProphetError:
+    return APIError(
+        message=message,
+        status_code=status,
+        error_type=kind or "authorization_error",
+        details=details,
+    )
+
+
+def _not_found_error(
+    status: int, message: str, kind: str | None, details: dict[str, Any] | None
+) -> ProphetError:
+    return APIError(
+        message=message, status_code=status, error_type=kind or "not_found", details=details
+    )
+
+
+def _api_error(
+    status: int, message: str, kind: str | None, details: dict[str, Any] | None
+) -> ProphetError:
+    return APIError(message=message, status_code=status, error_type=kind, details=details)
+
+
+# The REST error contract, by status code; anything else maps to a plain APIError.
+ERROR_HANDLERS: Mapping[int, ErrorFactory] = {
+    400: _validation_error,
+    401: _authentication_error,
+    403: _authorization_error,
+    404: _not_found_error,
+}
+
+
+def raise_for_response(
+    response: Any, handlers: Mapping[int, ErrorFactory] = ERROR_HANDLERS
+) -> None:
     """
     Map a non-2xx HTTP response to the right Prophet exception, or return for 2xx.
 
     Single source of truth for the REST error contract so every API surface
     raises consistently. Understands both error envelopes (see parse_error) and
     tolerates a non-JSON error body (e.g. a bare 500 from a proxy) instead of
-    crashing while trying to parse it.
+    crashing while trying to parse it. `handlers` lets an endpoint with its own
+    contract override individual statuses (see ERROR_HANDLERS).
     """
-    if response.status_code in (200, 201):
+    status = response.status_code
+    if status in (200, 201):
         return
 
     try:
@@ -135,21 +190,5 @@ def raise_for_response(response: Any) -> None:
     except Exception:
         data = {}
 
-    status = response.status_code
     message, kind, details = parse_error(data, f"Request failed with status {status}")
-
-    if status == 401:
-        raise AuthenticationError(message=message, code=kind, details=details)
-    if status == 400:
-        raise ValidationError(message=message, details=details)
-    if status == 403:
-        raise APIError(
-            message=message,
-            status_code=403,
-            error_type=kind or "authorization_error",
-            details=details,
-        )
-    if status == 404:
-        raise APIError(message=message, status_code=404, error_type=kind or "not_found",
-                       details=details)
-    raise APIError(message=message, status_code=status, error_type=kind, details=details)
+    raise handlers.get(status, _api_error)(status, message, kind, details)
@@ -1,11 +1,13 @@
 """Flows API submodule for querying flow records."""
 
 from .api import FlowsAPI
-from .iterator import FlowIterator
+from .iterator import AsyncFlowIterator, FlowIterator
 from .models import (
     BeaconData,
     DirectionFields,
     Flow,
+    FlowColumns,
+    FlowList,
     FlowPage,
     GeoEntry,
     Meta,
@@ -22,8 +24,11 @@ from .models import (
 __all__ = [
     "FlowsAPI",
     "FlowIterator",
+    "AsyncFlowIterator",
     "Flow",
     "FlowPage",
+    "FlowList",
+    "FlowColumns",
     "DirectionFields",
     "Transport",
     "Meta",
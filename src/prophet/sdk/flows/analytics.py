@@ -0,0 +1,74 @@
+"""Aggregation helpers over the column view of flow pages (FlowPage.to_arrays()).
+
+Each helper takes plain columns — `array.array`, lists, or NumPy arrays — rather
+than Flow objects, so a scan over many pages reads packed values in one pass:
+
+    from prophet.sdk.flows.analytics import top_k_by_bytes, u32_to_ipv4
+
+    cols = prophet.flows.query("inst-1").first().to_arrays()
+    for ip, total in top_k_by_bytes(cols.src_ip, cols.bytes, k=10):
+        print(u32_to_ipv4(ip), total)
+"""
+
+from __future__ import annotations
+
+import heapq
+import socket
+from collections.abc import Iterable
+from operator import itemgetter
+
+
+def _sum_by(keys: Iterable[int], values: Iterable[float]) -> dict[int, float]:
+    totals: dict[int, float] = {}
+    get = totals.get
+    for key, value in zip(keys, values, strict=True):
+        totals[key] = get(key, 0.0) + value
+    return totals
+
+
+def top_k_by_bytes(
+    src_ip: Iterable[int], bytes: Iterable[float], k: int = 10
+) -> list[tuple[int, float]]:
+    """
+    The `k` addresses with the most total bytes, largest first.
+
+    Args:
+        src_ip: uint32 IPv4 column (e.g. cols.src_ip or cols.dst_ip).
+        bytes: per-flow byte totals aligned with src_ip.
+        k: number of addresses to return.
+
+    Returns:
+        [(ip_u32, total_bytes), ...]; 0 (missing / non-IPv4) is excluded.
+    """
+    totals = _sum_by(src_ip, bytes)
+    totals.pop(0, None)
+    return heapq.nlargest(k, totals.items(), key=itemgetter(1))
+
+
+def bytes_by_port(dst_port: Iterable[int], bytes: Iterable[float]) -> dict[int, float]:
+    """Total bytes per destination port (port 0 = missing)."""
+    return _sum_by(dst_port, bytes)
+
+
+def count_by_cidr(src_ip: Iterable[int], prefix: int = 24) -> dict[int, int]:
+    """
+    Flow count per IPv4 network of the given prefix length.
+
+    Keys are the uint32 network address (render with u32_to_ipv4); 0
+    (missing / non-IPv4) is excluded.
+    """
+    if not 0 <= prefix <= 32:
+        raise ValueError("prefix must be between 0 and 32")
+    mask = (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF
+    counts: dict[int, int] = {}
+    get = counts.get
+    for ip in src_ip:
+        if ip:
+            net = ip & mask
+            counts[net] = get(net, 0) + 1
+    return counts
+
+
+def u32_to_ipv4(ip: int) -> str:
+    """Render a uint32 IPv4 address as a dotted quad."""
+    return socket.inet_ntop(socket.AF_INET, int(ip).to_bytes(4, "big"))
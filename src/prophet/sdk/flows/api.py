@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Literal
 
-from .iterator import FlowIterator
+from .iterator import AsyncFlowIterator, FlowIterator
 
 if TYPE_CHECKING:
     from ..client import Prophet
     from ..models import Sort, TimeFilter
     from ..query import Q
+    from .models import Flow
+
+# Cap on concurrent per-instance scans in collect_many(), to stay clear of rate limits.
+_MAX_INSTANCE_WORKERS = 5
 
 
 class FlowsAPI:
@@ -35,7 +40,9 @@ class FlowsAPI:
         end: TimeFilter | None = None,
         sort: list[Sort] | None = None,
         fields: list[str] | None = None,
-        size: int = 100,
+        size: int | Literal["auto"] = 100,
+        prefetch: bool = False,
+        rate_limit_retries: int = 3,
     ) -> FlowIterator:
         """
         Query flow records for one instance, with automatic pagination.
@@ -47,7 +54,14 @@ class FlowsAPI:
             end: end time filter (default: None).
             sort: list of Sort specifications.
             fields: fields to include in the response (None = all).
-            size: page size (default: 100, max: 25000).
+            size: page size (default: 100, max: 25000). "auto" sizes the pages
+                for the scan: one page of take()/collect(limit) results when a
+                limit is set, otherwise large pages to cut round-trips.
+            prefetch: fetch the next page in the background while the current
+                one is consumed (default: False).
+            rate_limit_retries: times to retry a page the server rate-limits
+                (429), waiting per Retry-After or with jittered backoff
+                (default: 3; 0 = raise immediately).
 
         Returns:
             FlowIterator over the matching flows.
@@ -61,8 +75,93 @@ class FlowsAPI:
             sort=sort,
             fields=fields,
             size=size,
+            prefetch=prefetch,
+            rate_limit_retries=rate_limit_retries,
+        )
+
+    def aquery(
+        self,
+        instance: str,
+        query: str | Q = "",
+        start: TimeFilter | None = None,
+        end: TimeFilter | None = None,
+        sort: list[Sort] | None = None,
+        fields: list[str] | None = None,
+        size: int | Literal["auto"] = 100,
+        rate_limit_retries: int = 3,
+    ) -> AsyncFlowIterator:
+        """
+        Async variant of query(): `async for flow in prophet.flows.aquery(...)`.
+
+        Takes the same arguments as query() except prefetch: pages are always
+        fetched off the event loop, with the next page requested while the
+        current one is consumed.
+
+        Returns:
+            AsyncFlowIterator over the matching flows.
+        """
+        return AsyncFlowIterator(
+            self.query(
+                instance=instance,
+                query=query,
+                start=start,
+                end=end,
+                sort=sort,
+                fields=fields,
+                size=size,
+                rate_limit_retries=rate_limit_retries,
+            )
         )
 
+    def collect_many(
+        self,
+        instances: list[str],
+        query: str | Q = "",
+        start: TimeFilter | None = None,
+        end: TimeFilter | None = None,
+        sort: list[Sort] | None = None,
+        fields: list[str] | None = None,
+        size: int | Literal["auto"] = 100,
+        limit: int | None = None,
+        max_workers: int = _MAX_INSTANCE_WORKERS,
+    ) -> dict[str, list[Flow]]:
+        """
+        Run the same query against several instances concurrently.
+
+        Each instance is scanned on its own worker over the shared connection
+        pool, so the wall time is roughly that of the slowest instance rather
+        than the sum. EAGER, like collect() — pass a `limit` (applied per
+        instance) to bound memory.
+
+        Args:
+            instances: instance IDs to search.
+            limit: maximum flows to collect per instance (None = all matches).
+            max_workers: maximum instances scanned at once (default: 5).
+            (other arguments as for query())
+
+        Returns:
+            dict mapping each instance ID to its list of flows.
+        """
+        if not instances:
+            return {}
+
+        def scan(instance: str) -> list[Flow]:
+            return self.query(
+                instance=instance,
+                query=query,
+                start=start,
+                end=end,
+                sort=sort,
+                fields=fields,
+                size=size,
+            ).collect(limit)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(instances)),
+            thread_name_prefix="prophet-instances",
+        ) as pool:
+            return dict(zip(instances, pool.map(scan, instances), strict=True))
+
     def __call__(
         self,
         instance: str,
@@ -71,7 +170,9 @@ class FlowsAPI:
         end: TimeFilter | None = None,
         sort: list[Sort] | None = None,
         fields: list[str] | None = None,
-        size: int = 100,
+        size: int | Literal["auto"] = 100,
+        prefetch: bool = False,
+        rate_limit_retries: int = 3,
     ) -> FlowIterator:
         """Shortcut: prophet.flows(...) is equivalent to prophet.flows.query(...)."""
         return self.query(
@@ -82,4 +183,6 @@ class FlowsAPI:
             sort=sort,
             fields=fields,
             size=size,
+            prefetch=prefetch,
+            rate_limit_retries=rate_limit_retries,
         )
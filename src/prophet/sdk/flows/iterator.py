@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import math
+import random
+import time
 from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, NoReturn
 
-from ..exceptions import APIError, AuthenticationError, parse_error
-from .models import Flow, FlowPage
+from .. import _json
+from ..exceptions import ERROR_HANDLERS, APIError, ProphetError, raise_for_response
+from .models import Flow, FlowColumns, FlowPage
 
 if TYPE_CHECKING:
     from ..client import Prophet
@@ -14,6 +21,44 @@ if TYPE_CHECKING:
     from ..query import Q
 
 
+def _search_validation_error(
+    status: int, message: str, kind: str | None, details: dict[str, Any] | None
+) -> ProphetError:
+    return APIError(
+        message=message,
+        status_code=status,
+        error_type=kind or "validation_error",
+        details=details,
+    )
+
+
+# The search-api reports a rejected query (e.g. a PQL parse failure) as an
+# APIError carrying the 400, not as a client-side ValidationError.
+_SEARCH_ERROR_HANDLERS = {**ERROR_HANDLERS, 400: _search_validation_error}
+
+# Backoff between retries of a rate-limited (429) page when the server sends no
+# usable Retry-After: 0.5s, 1s, 2s, ... each stretched by up to 25% jitter so
+# parallel iterators don't retry in lockstep. Retry-After is capped likewise.
+_RATE_LIMIT_BACKOFF = 0.5
+_MAX_RETRY_DELAY = 60.0
+
+
+def _retry_delay(response: Any, attempt: int) -> float:
+    """Seconds to wait before retrying a 429: Retry-After if given, else backoff."""
+    try:
+        delay = float(response.headers.get("Retry-After", ""))
+    except ValueError:  # absent, or an HTTP-date
+        delay = math.nan
+    if not math.isfinite(delay):  # also "nan"/"inf", which float() accepts
+        delay = _RATE_LIMIT_BACKOFF * 2**attempt
+    return min(max(delay, 0.0), _MAX_RETRY_DELAY) * (1 + random.random() / 4)
+
+
+# Server-side cap on `size`, and the page size size="auto" uses for unbounded scans.
+_MAX_PAGE_SIZE = 25000
+_AUTO_PAGE_SIZE = 5000
+
+
 class FlowIterator:
     """
     Lazy iterator over flow records with automatic pagination.
@@ -21,9 +66,19 @@ class FlowIterator:
     Supports:
     - Iteration: `for flow in iterator:`
     - Limiting: `iterator.take(100)`
+    - Projection: `iterator.select("src.ip", "dst.port")`
     - First page: `iterator.first()`
     - Collect all: `iterator.collect()`
     - Manual pagination: `iterator.next_page()`
+    - Whole pages: `iterator.batches()` / `iterator.record_batches()`
+
+    A page answered with 429 (rate limited) is retried up to `rate_limit_retries`
+    times, honoring Retry-After, before the error propagates.
+
+    With `prefetch=True`, the next page is requested on a background thread as
+    soon as the current one arrives, so the HTTP round-trip overlaps with the
+    caller consuming the current page. Use the iterator as a context manager (or
+    call close()) to drop an outstanding prefetch when breaking out early.
     """
 
     def __init__(
@@ -35,7 +90,9 @@ class FlowIterator:
         end: TimeFilter | None,
         sort: list[Sort] | None,
         fields: list[str] | None,
-        size: int,
+        size: int | Literal["auto"],
+        prefetch: bool = False,
+        rate_limit_retries: int = 3,
     ) -> None:
         self._client = client
         self._instance = instance
@@ -45,14 +102,23 @@ class FlowIterator:
         self._sort = sort
         self._fields = fields
         self._size = size
+        self._page_size = 0  # resolved with the request body on first fetch
+        self._prefetch = prefetch
+        self._rate_limit_retries = rate_limit_retries
+        self._encoded_prefix: bytes | None = None
 
         # Iteration state
         self._current_page: FlowPage | None = None
         self._page_num = 0
-        self._flow_index = 0
+        self._flows: Iterator[Flow] = iter(())  # unread flows of the current page
         self._total_yielded = 0
         self._limit: int | None = None
-        self._exhausted = False
+        self._exhausted = False  # no pages left to fetch
+        self._done = False  # iteration finished (StopIteration raised)
+
+        # Background prefetch state (only used when prefetch=True)
+        self._executor: ThreadPoolExecutor | None = None
+        self._next_page: Future[FlowPage] | None = None
 
     def take(self, n: int) -> FlowIterator:
         """
@@ -67,6 +133,27 @@ class FlowIterator:
         self._limit = n
         return self
 
+    def select(self, *fields: str) -> FlowIterator:
+        """
+        Ask the server for only these fields (same as passing `fields=`).
+
+        Unrequested nested objects (meta, threat, beacon, ...) are then never
+        sent, decoded or validated, which shrinks narrow scans considerably.
+
+        Args:
+            *fields: dotted field paths, e.g. "src.ip", "dst.port"
+
+        Returns:
+            Self for chaining
+
+        Raises:
+            ValueError: if called after the first page has been requested
+        """
+        if self._encoded_prefix is not None:
+            raise ValueError("select() must be called before iteration starts")
+        self._fields = list(fields) or None
+        return self
+
     def first(self) -> FlowPage:
         """
         Fetch and return only the first page.
@@ -102,7 +189,11 @@ class FlowIterator:
         if self._exhausted:
             return None
 
-        page = self._fetch_page(self._page_num)
+        if self._next_page is not None:
+            future, self._next_page = self._next_page, None
+            page = future.result()
+        else:
+            page = self._fetch_page(self._page_num)
         self._page_num += 1
 
         if not page.has_more:
@@ -110,99 +201,149 @@ class FlowIterator:
 
         return page
 
+    def batches(self) -> Iterator[FlowPage]:
+        """
+        Iterate page by page instead of flow by flow.
+
+        Prefer this for analytics: each step hands over a whole FlowPage, so
+        per-row work can be done in bulk (see FlowPage.to_arrays()) rather than
+        one Python-level loop trip per flow. Honors take() — the last page is
+        trimmed to the limit — and prefetch.
+
+        Yields:
+            FlowPage for each page of results
+        """
+        try:
+            while self._limit is None or self._total_yielded < self._limit:
+                page = self.next_page()
+                if page is None:
+                    return
+                if self._limit is not None:
+                    remaining = self._limit - self._total_yielded
+                    if len(page.flows) > remaining:
+                        page = dataclasses.replace(page, flows=page.flows[:remaining])
+                self._total_yielded += len(page.flows)
+                self._current_page = page
+                self._schedule_prefetch(unread=0)
+                yield page
+        finally:
+            self.close()
+
+    def record_batches(self) -> Iterator[FlowColumns]:
+        """
+        Iterate page by page as column arrays (see FlowPage.to_arrays()).
+
+        Yields:
+            FlowColumns for each page of results
+        """
+        for page in self.batches():
+            yield page.to_arrays()
+
     def __iter__(self) -> Iterator[Flow]:
         return self
 
     def __next__(self) -> Flow:
-        # Check if we've hit the limit
-        if self._limit is not None and self._total_yielded >= self._limit:
+        if self._done:
             raise StopIteration
+        if self._limit is not None and self._total_yielded >= self._limit:
+            self._stop()
+
+        while True:
+            flow = next(self._flows, None)
+            if flow is not None:
+                self._total_yielded += 1
+                return flow
+            # Current page drained: move on (taking over any prefetched page)
+            page = self.next_page()
+            if page is None:
+                self._stop()
+            self._current_page = page
+            self._flows = iter(page.flows)
+            self._schedule_prefetch(unread=len(page.flows))
+
+    def _stop(self) -> NoReturn:
+        self._done = True
+        self.close()
+        raise StopIteration
+
+    def close(self) -> None:
+        """Cancel any outstanding prefetch and release the background worker."""
+        if self._next_page is not None:
+            self._next_page.cancel()
+            self._next_page = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self) -> FlowIterator:
+        return self
 
-        # Fetch first page if needed
-        if self._current_page is None:
-            self._current_page = self._fetch_page(0)
-            self._page_num = 1
-
-        # Move to next page if current page exhausted
-        while self._flow_index >= len(self._current_page.flows):
-            if not self._current_page.has_more:
-                raise StopIteration
-            self._current_page = self._fetch_page(self._page_num)
-            self._page_num += 1
-            self._flow_index = 0
-
-        # Return next flow
-        flow = self._current_page.flows[self._flow_index]
-        self._flow_index += 1
-        self._total_yielded += 1
-        return flow
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _schedule_prefetch(self, unread: int) -> None:
+        """Start fetching the page after the current one, if it will be needed."""
+        page = self._current_page
+        if not self._prefetch or page is None or not page.has_more:
+            return
+        # Skip the fetch when the current page already satisfies take()/collect(limit).
+        if self._limit is not None and self._total_yielded + unread >= self._limit:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="prophet-prefetch"
+            )
+        self._next_page = self._executor.submit(self._fetch_page, self._page_num)
+
+    def _body_prefix(self) -> bytes:
+        """
+        The encoded request body minus the per-page fields, built on first use.
+
+        Everything but `size` and `page` is fixed for the iterator's lifetime, so
+        it is serialized once and each page just splices its two integers onto the
+        prefix (the encoded object with its closing brace dropped).
+        """
+        if self._encoded_prefix is None:
+            payload: dict[str, Any] = {
+                "instance_ids": [self._instance],
+                "module": "flows",
+            }
+            if self._query:
+                payload["sentence"] = self._query
+            if self._start is not None:
+                payload["start"] = self._start.to_dict()
+            if self._end is not None:
+                payload["end"] = self._end.to_dict()
+            if self._sort:
+                payload["sort"] = [s.to_dict() for s in self._sort]
+            if self._fields:
+                payload["fields"] = self._fields
+            # Pages are addressed by index, so the size is fixed for the whole
+            # scan; a take()/collect(limit) smaller than a page shrinks it.
+            limit = self._limit
+            if self._size == "auto":
+                self._page_size = min(limit, _MAX_PAGE_SIZE) if limit else _AUTO_PAGE_SIZE
+            else:
+                self._page_size = min(self._size, limit) if limit else self._size
+            self._encoded_prefix = _json.dumps(payload)[:-1]
+        return self._encoded_prefix
 
     def _fetch_page(self, page: int) -> FlowPage:
         """Make API request for a specific page."""
-        # Build request payload
-        payload: dict[str, Any] = {
-            "instance_ids": [self._instance],
-            "module": "flows",
-            "size": self._size,
-            "page": page,
-        }
-
-        if self._query:
-            payload["sentence"] = self._query
-
-        if self._start is not None:
-            payload["start"] = self._start.to_dict()
-
-        if self._end is not None:
-            payload["end"] = self._end.to_dict()
-
-        if self._sort:
-            payload["sort"] = [s.to_dict() for s in self._sort]
-
-        if self._fields:
-            payload["fields"] = self._fields
-
-        # Make request
-        response = self._client._request("POST", "/search/records/1.0", json=payload)
-
-        # Handle errors. The search-api wraps errors in a nested envelope —
-        # {"error": {"code", "message", "type", "details"}, "timestamp": ...} —
-        # which parse_error prefers, falling back to the older flat
-        # {"error": "...", "code": "..."} shape.
-        status = response.status_code
-        if status in (400, 401, 403):
-            try:
-                body = response.json()
-            except Exception:  # non-JSON error body — parse_error falls back
-                body = None
-            if status == 401:
-                message, kind, details = parse_error(body, "Authentication failed")
-                raise AuthenticationError(message=message, code=kind, details=details)
-            if status == 403:
-                message, kind, details = parse_error(body, "Authorization failed")
-                raise APIError(
-                    message=message,
-                    status_code=403,
-                    error_type=kind or "authorization_error",
-                    details=details,
-                )
-            message, kind, details = parse_error(body, "Validation failed")
-            raise APIError(
-                message=message,
-                status_code=400,
-                error_type=kind or "validation_error",
-                details=details,
-            )
+        request_body = self._body_prefix() + b',"size":%d,"page":%d}' % (self._page_size, page)
 
-        if response.status_code != 200:
-            raise APIError(
-                message=f"Search request failed with status {response.status_code}",
-                status_code=response.status_code,
-            )
+        # Search is a read, so a rate-limited page is safe to re-request. (The
+        # session's urllib3 retries never cover POST.)
+        for attempt in range(self._rate_limit_retries + 1):
+            response = self._client._request("POST", "/search/records/1.0", data=request_body)
+            if response.status_code != 429 or attempt == self._rate_limit_retries:
+                break
+            time.sleep(_retry_delay(response, attempt))
 
-        data = response.json()
-        instance_data = data.get(self._instance, {})
-        return FlowPage.from_response(instance_data, self._instance)
+        # The search-api wraps errors in a nested envelope, which
+        # raise_for_response understands alongside the older flat shape.
+        raise_for_response(response, _SEARCH_ERROR_HANDLERS)
+        return FlowPage.from_json(response.content, self._instance)
 
     @property
     def total_found(self) -> int | None:
@@ -215,3 +356,81 @@ class FlowIterator:
         if self._current_page is None:
             return None
         return self._current_page.found
+
+
+class AsyncFlowIterator:
+    """
+    Async iterator over flow records: `async for flow in prophet.flows.aquery(...)`.
+
+    Pages are fetched on worker threads over the client's pooled session, so the
+    event loop is never blocked and several queries (e.g. one per instance) can run
+    concurrently under `asyncio.gather`. The next page is requested as soon as the
+    current one arrives, overlapping the round-trip with consumption.
+
+    Example:
+        async def top(instance: str) -> list[Flow]:
+            return await prophet.flows.aquery(instance, Q("dst.port").eq(443)).collect(10)
+
+        results = await asyncio.gather(*(top(i) for i in ["inst-1", "inst-2"]))
+    """
+
+    def __init__(self, pages: FlowIterator) -> None:
+        self._pages = pages
+        self._flows: Iterator[Flow] = iter(())
+        self._pending: asyncio.Task[FlowPage | None] | None = None
+        self._yielded = 0
+        self._done = False
+
+    def take(self, n: int) -> AsyncFlowIterator:
+        """Limit total results returned across all pages."""
+        self._pages.take(n)
+        return self
+
+    async def collect(self, limit: int | None = None) -> list[Flow]:
+        """Collect results into a list (pass a `limit` to bound memory)."""
+        if limit is not None:
+            self._pages.take(limit)
+        return [flow async for flow in self]
+
+    async def aclose(self) -> None:
+        """Cancel any in-flight page request and drop the buffered page; iteration ends."""
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        self._flows = iter(())
+        self._done = True
+
+    def __aiter__(self) -> AsyncFlowIterator:
+        return self
+
+    async def __anext__(self) -> Flow:
+        limit = self._pages._limit
+        if limit is not None and self._yielded >= limit:
+            await self.aclose()
+            raise StopAsyncIteration
+
+        while True:
+            flow = next(self._flows, None)
+            if flow is not None:
+                self._yielded += 1
+                return flow
+            if self._pending is None:
+                if self._done:
+                    raise StopAsyncIteration
+                self._pending = self._request_next()
+            try:
+                page = await self._pending
+            finally:
+                # a failed request isn't re-awaited; the next call requests again
+                self._pending = None
+            if page is None:
+                self._done = True
+                raise StopAsyncIteration
+            self._flows = iter(page.flows)
+            if not page.has_more:
+                self._done = True
+            elif limit is None or self._yielded + len(page.flows) < limit:
+                self._pending = self._request_next()
+
+    def _request_next(self) -> asyncio.Task[FlowPage | None]:
+        return asyncio.ensure_future(asyncio.to_thread(self._pages.next_page))
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import socket
+from array import array
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, overload
+
+import pydantic_core
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+# Bound once for Flow.timestamp_dt, which callers read for every row of a page.
+_from_timestamp = datetime.fromtimestamp
+_UTC = timezone.utc
 
-from pydantic import BaseModel, ConfigDict, Field
 
 # =============================================================================
 # Pydantic Base Config
@@ -14,14 +24,24 @@ from pydantic import BaseModel, ConfigDict, Field
 
 
 class FlowModel(BaseModel):
-    """Base model for all flow-related models."""
+    """
+    Base model for all flow-related models.
+
+    Unknown keys are dropped on the nested leaf models: a page holds tens of
+    thousands of them and keeping an extras dict on each one costs memory and
+    decode time for fields nobody reads. Flow and Meta, where the server adds
+    new fields, override this with extra="allow" for forward-compat.
+    """
 
     model_config = ConfigDict(
         populate_by_name=True,
-        extra="allow",
+        extra="ignore",
     )
 
 
+_FORWARD_COMPAT = ConfigDict(populate_by_name=True, extra="allow")
+
+
 # =============================================================================
 # Geo Models
 # =============================================================================
@@ -156,6 +176,8 @@ class Path(FlowModel):
 class Meta(FlowModel):
     """Flow metadata."""
 
+    model_config = _FORWARD_COMPAT
+
     ingest_time: int | None = Field(None, alias="@ingest_time")
     customer_id: str | None = None
     tags: list[str] | None = None
@@ -452,6 +474,8 @@ class Flow(FlowModel):
     All fields are optional since flows may have varying levels of detail.
     """
 
+    model_config = _FORWARD_COMPAT
+
     # Core identifiers
     id: str | None = None
     doc_type: str | None = None
@@ -502,53 +526,64 @@ class Flow(FlowModel):
         """Get timestamp as a timezone-aware UTC datetime (wire value is epoch-ms UTC)."""
         if self.timestamp is None:
             return None
-        return datetime.fromtimestamp(self.timestamp / 1000, tz=timezone.utc)
+        return _from_timestamp(self.timestamp / 1000, _UTC)
 
     @property
     def bytes(self) -> float:
         """Get total bytes (from metric or stats)."""
-        if self.metric and self.metric.total_bytes is not None:
-            return self.metric.total_bytes
-        if self.stats and self.stats.volume and self.stats.volume.bytes:
-            return self.stats.volume.bytes.total or 0
-        return 0
+        metric = self.metric
+        if metric is not None and metric.total_bytes is not None:
+            return metric.total_bytes
+        volume = self._volume()
+        counter = volume.bytes if volume is not None else None
+        return (counter.total or 0) if counter is not None else 0
 
     @property
     def packets(self) -> float:
         """Get total packets."""
-        if self.stats and self.stats.volume and self.stats.volume.packets:
-            return self.stats.volume.packets.total or 0
-        return 0
+        volume = self._volume()
+        counter = volume.packets if volume is not None else None
+        return (counter.total or 0) if counter is not None else 0
+
+    def _volume(self) -> VolumeMetrics | None:
+        stats = self.stats
+        return stats.volume if stats is not None else None
 
     @property
     def src_ip(self) -> str:
         """Shortcut to source IP."""
-        return self.src.ip if self.src and self.src.ip else ""
+        src = self.src
+        return (src.ip or "") if src is not None else ""
 
     @property
     def dst_ip(self) -> str:
         """Shortcut to destination IP."""
-        return self.dst.ip if self.dst and self.dst.ip else ""
+        dst = self.dst
+        return (dst.ip or "") if dst is not None else ""
 
     @property
     def src_port(self) -> int:
         """Shortcut to source port."""
-        return self.src.port if self.src and self.src.port else 0
+        src = self.src
+        return (src.port or 0) if src is not None else 0
 
     @property
     def dst_port(self) -> int:
         """Shortcut to destination port."""
-        return self.dst.port if self.dst and self.dst.port else 0
+        dst = self.dst
+        return (dst.port or 0) if dst is not None else 0
 
     @property
     def protocol(self) -> str:
         """Get transport protocol."""
-        return self.transport.proto if self.transport and self.transport.proto else ""
+        transport = self.transport
+        return (transport.proto or "") if transport is not None else ""
 
     @property
     def instance_id(self) -> str:
         """Get instance/customer ID."""
-        return self.meta.customer_id if self.meta and self.meta.customer_id else ""
+        meta = self.meta
+        return (meta.customer_id or "") if meta is not None else ""
 
     def __repr__(self) -> str:
         return (
@@ -561,12 +596,259 @@ class Flow(FlowModel):
 # Page Models
 # =============================================================================
 
+# Flow's compiled pydantic-core validator, bound once: validating a row is then a
+# single native call, without model_validate's classmethod dispatch per row.
+_validate_flow = Flow.__pydantic_validator__.validate_python
+
+
+class FlowList(Sequence[Flow]):
+    """
+    The rows of a FlowPage, each validated into a Flow on first access.
+
+    Rows are held as decoded JSON and only pay for model construction when read,
+    so `take(n)` / `first()` / breaking out of a loop early never validate the
+    rest of a large page. Behaves like a read-only list of Flow.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, rows: list[dict[str, Any]] | list[Flow]) -> None:
+        self._items: list[Any] = list(rows)
+
+    @overload
+    def __getitem__(self, index: int) -> Flow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> FlowList: ...
+
+    def __getitem__(self, index: int | slice) -> Flow | FlowList:
+        if isinstance(index, slice):
+            return FlowList(self._items[index])  # still lazy
+        item = self._items[index]
+        if isinstance(item, Flow):
+            return item
+        flow: Flow = _validate_flow(item)
+        self._items[index] = flow  # cache, and drop the raw row
+        return flow
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Flow]:
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (FlowList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def where(self, **equals: Any) -> FlowList:
+        """
+        Rows whose columns equal the given values (see FlowColumns.where); still lazy.
+
+        Only the columns named in `equals` are read.
+        """
+        items = self._items
+        return FlowList([items[i] for i in _matching(self._column, len(items), equals)])
+
+    def to_arrays(self) -> FlowColumns:
+        """Column view of these rows, read without constructing Flow models."""
+        return FlowColumns(**{name: self._column(name) for name in _COLUMN_READERS})
+
+    def _column(self, name: str) -> Any:
+        """One column: read off Flow attributes, or straight from the raw row."""
+        typecode, from_flow, from_row = _COLUMN_READERS[name]
+        values = (
+            from_flow(item) if isinstance(item, Flow) else from_row(item) for item in self._items
+        )
+        return array(typecode, values) if typecode else list(values)
+
+    def __repr__(self) -> str:
+        return f"FlowList({len(self._items)} flows)"
+
+
+# Stand-in for an absent sub-object when reading raw rows, shared so a missing
+# "src"/"stats"/... doesn't allocate a fresh empty dict per row. Never mutated.
+_ABSENT: dict[str, Any] = {}
+
+_UINT16 = (0, 0xFFFF)
+_INT64 = (-(2**63), 2**63 - 1)
+
+
+def _sub(row: dict[str, Any], key: str) -> dict[str, Any]:
+    """A raw row's sub-object, or _ABSENT if it's missing or not an object."""
+    value = row.get(key)
+    return value if isinstance(value, dict) else _ABSENT
+
+
+def _as_int(value: Any, bounds: tuple[int, int]) -> int:
+    """
+    An integer column value coerced the way Flow's lax validation would ("80" -> 80);
+    0 if missing, malformed or outside the column's C type.
+    """
+    try:
+        number = int(value)
+    except (TypeError, ValueError, OverflowError):
+        return 0
+    return number if bounds[0] <= number <= bounds[1] else 0
+
+
+def _as_float(value: Any) -> float:
+    """A float column value ("1.5" -> 1.5); 0.0 if missing or malformed."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _ipv4_u32(ip: Any) -> int:
+    """Dotted-quad IPv4 as an unsigned 32-bit int; 0 for missing or non-IPv4."""
+    return _parse_ipv4(ip) if isinstance(ip, str) and ip else 0
+
+
+@lru_cache(maxsize=4096)
+def _parse_ipv4(ip: str) -> int:
+    # Memoized: a page repeats the same few hosts across many rows.
+    try:
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, ip), "big")
+    except OSError:
+        return 0
+
+
+def _total_bytes(row: dict[str, Any]) -> float:
+    """Flow.bytes, read straight off a raw row (metric.total_bytes, else stats)."""
+    total = _sub(row, "metric").get("total_bytes")
+    if total is not None:
+        return _as_float(total)
+    volume = _sub(_sub(_sub(row, "stats"), "volume"), "bytes")
+    return _as_float(volume.get("total"))
+
+
+# FlowColumns field -> (array typecode or None for a list, reader for a
+# materialized Flow, reader for a raw row dict). Raw values are coerced, since
+# rows hold JSON as sent and Flow validation is lax ("80", 1.7e12, ...).
+_COLUMN_READERS: dict[str, tuple[str | None, Callable[[Flow], Any], Callable[[Any], Any]]] = {
+    "src_ip": ("I", lambda f: _ipv4_u32(f.src_ip), lambda r: _ipv4_u32(_sub(r, "src").get("ip"))),
+    "dst_ip": ("I", lambda f: _ipv4_u32(f.dst_ip), lambda r: _ipv4_u32(_sub(r, "dst").get("ip"))),
+    "src_port": (
+        "H",
+        lambda f: _as_int(f.src_port, _UINT16),
+        lambda r: _as_int(_sub(r, "src").get("port"), _UINT16),
+    ),
+    "dst_port": (
+        "H",
+        lambda f: _as_int(f.dst_port, _UINT16),
+        lambda r: _as_int(_sub(r, "dst").get("port"), _UINT16),
+    ),
+    "bytes": ("d", lambda f: _as_float(f.bytes), _total_bytes),
+    "timestamp": (
+        "q",
+        lambda f: _as_int(f.timestamp, _INT64),
+        lambda r: _as_int(r.get("@timestamp"), _INT64),
+    ),
+    "app_name": (None, lambda f: f.app_name, lambda r: r.get("app_name")),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FlowColumns:
+    """
+    Column-oriented (structure-of-arrays) view of a page of flows.
+
+    Each numeric column is a typed `array.array` — a contiguous C buffer, so
+    filters and aggregates over one field walk packed values instead of chasing
+    per-flow objects, and NumPy can wrap a column without copying
+    (`np.frombuffer(cols.dst_port, dtype=np.uint16)`). Missing values are 0
+    (None for app_name); IPv6 addresses are 0 in the IPv4 columns.
+    """
+
+    src_ip: array[int]  # IPv4 as uint32 ('I')
+    dst_ip: array[int]  # IPv4 as uint32 ('I')
+    src_port: array[int]  # uint16 ('H')
+    dst_port: array[int]  # uint16 ('H')
+    bytes: array[float]  # float64 ('d'), same value as Flow.bytes
+    timestamp: array[int]  # epoch-ms int64 ('q')
+    app_name: list[str | None]
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def where(self, **equals: Any) -> list[int]:
+        """
+        Indices of the rows whose columns equal every given value.
+
+        IP columns accept dotted-quad strings as well as uint32 ints; a string
+        that isn't an IPv4 address raises ValueError (IPv6 rows hold 0).
+
+        Example:
+            https = cols.where(dst_port=443, src_ip="10.0.0.1")
+        """
+        return _matching(lambda name: getattr(self, name), len(self), equals)
+
+
+def _matching(column: Callable[[str], Any], count: int, equals: dict[str, Any]) -> list[int]:
+    """Indices matching `equals`, fetching only the named columns through `column`."""
+    matches: list[int] | None = None
+    for name, value in equals.items():
+        if name not in _COLUMN_READERS:
+            raise ValueError(
+                f"Unknown column {name!r}; expected one of {', '.join(_COLUMN_READERS)}"
+            )
+        if name in ("src_ip", "dst_ip") and isinstance(value, str):
+            # 0 is the column's "missing / not IPv4" value, so an address that
+            # doesn't parse must not turn into it and match those rows
+            value = _ipv4_u32(value)
+            if value == 0 and equals[name] != "0.0.0.0":
+                raise ValueError(f"{name} filter {equals[name]!r} is not an IPv4 address")
+        values = column(name)
+        if matches is None:
+            matches = [i for i, v in enumerate(values) if v == value]
+        else:
+            matches = [i for i in matches if values[i] == value]
+    return matches if matches is not None else list(range(count))
+
+
+class _PageBody(BaseModel):
+    """One instance's block of an already-parsed search response."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    # Any, so validation hands back the parsed row dicts themselves instead of
+    # shallow-copying each one; FlowList validates rows when they're read.
+    flows: list[Any] = []
+    found: int = 0
+    total: int = 0
+    returned: int | None = None
+    current_page: int = 0
+    pages: int = 1
+    more_data_available: bool = False
+    took: float = 0.0
+
+
+class _SearchEnvelope(BaseModel):
+    """Search response keyed by instance id; see _envelope()."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    page: _PageBody | None = None
+
+
+@lru_cache(maxsize=64)
+def _envelope(instance_id: str) -> type[_SearchEnvelope]:
+    """Response envelope that picks out one instance's block and ignores the rest."""
+    return create_model(
+        "_SearchEnvelope",
+        __base__=_SearchEnvelope,
+        page=(_PageBody | None, Field(None, alias=instance_id)),
+    )
+
 
-@dataclass
+@dataclass(slots=True)
 class FlowPage:
     """A page of flow results."""
 
-    flows: list[Flow]
+    flows: Sequence[Flow]
     found: int
     total: int
     returned: int
@@ -576,11 +858,32 @@ class FlowPage:
     took: float
     instance_id: str
 
+    def to_arrays(self) -> FlowColumns:
+        """
+        Column (structure-of-arrays) view of this page for vectorized analytics.
+
+        Example:
+            cols = page.to_arrays()
+            https_bytes = sum(b for p, b in zip(cols.dst_port, cols.bytes) if p == 443)
+        """
+        return self._flow_list().to_arrays()
+
+    def where(self, **equals: Any) -> FlowList:
+        """
+        Flows whose columns equal the given values, filtered on the column view.
+
+        Example:
+            https = page.where(dst_port=443)
+        """
+        return self._flow_list().where(**equals)
+
+    def _flow_list(self) -> FlowList:
+        return self.flows if isinstance(self.flows, FlowList) else FlowList(list(self.flows))
+
     @classmethod
     def from_response(cls, data: dict[str, Any], instance_id: str) -> FlowPage:
         """Create FlowPage from API response data for a single instance."""
-        raw_flows = data.get("flows", [])
-        flows = [Flow.model_validate(f) for f in raw_flows]
+        flows = FlowList(data.get("flows") or [])
         return cls(
             flows=flows,
             found=data.get("found", 0),
@@ -592,3 +895,29 @@ class FlowPage:
             took=data.get("took", 0.0),
             instance_id=instance_id,
         )
+
+    @classmethod
+    def from_json(cls, content: bytes | str, instance_id: str) -> FlowPage:
+        """
+        Create FlowPage from a raw search response body.
+
+        The body is parsed once by pydantic-core; the envelope model then only
+        checks the page counters and passes the parsed rows through as they
+        are. Rows are validated lazily (see FlowList). The parser caches short
+        strings, so the values a page repeats on every row (app names,
+        protocols, country codes, IPs) decode to one shared str object each
+        rather than a fresh copy per row.
+        """
+        data = pydantic_core.from_json(content, cache_strings=True)
+        body = _envelope(instance_id).model_validate(data).page or _PageBody()
+        return cls(
+            flows=FlowList(body.flows),
+            found=body.found,
+            total=body.total,
+            returned=body.returned if body.returned is not None else len(body.flows),
+            current_page=body.current_page,
+            page_count=body.pages,
+            has_more=body.more_data_available,
+            took=body.took,
+            instance_id=instance_id,
+        )
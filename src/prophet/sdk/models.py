@@ -5,7 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
 # =============================================================================
 # Time Filters (for query building)
@@ -15,13 +15,15 @@ from typing import Any, Literal
 class TimeFilter(ABC):
     """Base class for time filter specifications."""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_dict(self) -> dict[str, Any]:
         """Convert to API request format."""
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Now(TimeFilter):
     """Current time specification."""
 
@@ -29,9 +31,11 @@ class Now(TimeFilter):
         return {"now": True}
 
 
-@dataclass(frozen=True)
-class MinutesAgo(TimeFilter):
-    """Relative time: N minutes ago."""
+@dataclass(frozen=True, slots=True)
+class _RelativeTime(TimeFilter):
+    """Relative time: `value` units ago (unit set by each subclass)."""
+
+    _unit: ClassVar[str]
 
     value: int
 
@@ -40,52 +44,38 @@ class MinutesAgo(TimeFilter):
             raise ValueError("value must be positive")
 
     def to_dict(self) -> dict[str, Any]:
-        return {"relative": {"value": self.value, "unit": "minutes"}}
+        return {"relative": {"value": self.value, "unit": self._unit}}
 
 
-@dataclass(frozen=True)
-class HoursAgo(TimeFilter):
-    """Relative time: N hours ago."""
+@dataclass(frozen=True, slots=True)
+class MinutesAgo(_RelativeTime):
+    """Relative time: N minutes ago."""
 
-    value: int
+    _unit: ClassVar[str] = "minutes"
 
-    def __post_init__(self) -> None:
-        if self.value <= 0:
-            raise ValueError("value must be positive")
-
-    def to_dict(self) -> dict[str, Any]:
-        return {"relative": {"value": self.value, "unit": "hours"}}
 
+@dataclass(frozen=True, slots=True)
+class HoursAgo(_RelativeTime):
+    """Relative time: N hours ago."""
 
-@dataclass(frozen=True)
-class DaysAgo(TimeFilter):
-    """Relative time: N days ago."""
+    _unit: ClassVar[str] = "hours"
 
-    value: int
 
-    def __post_init__(self) -> None:
-        if self.value <= 0:
-            raise ValueError("value must be positive")
+@dataclass(frozen=True, slots=True)
+class DaysAgo(_RelativeTime):
+    """Relative time: N days ago."""
 
-    def to_dict(self) -> dict[str, Any]:
-        return {"relative": {"value": self.value, "unit": "days"}}
+    _unit: ClassVar[str] = "days"
 
 
-@dataclass(frozen=True)
-class WeeksAgo(TimeFilter):
+@dataclass(frozen=True, slots=True)
+class WeeksAgo(_RelativeTime):
     """Relative time: N weeks ago."""
 
-    value: int
-
-    def __post_init__(self) -> None:
-        if self.value <= 0:
-            raise ValueError("value must be positive")
-
-    def to_dict(self) -> dict[str, Any]:
-        return {"relative": {"value": self.value, "unit": "weeks"}}
+    _unit: ClassVar[str] = "weeks"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class At(TimeFilter):
     """Absolute time specification."""
 
@@ -102,7 +92,7 @@ class At(TimeFilter):
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Sort:
     """Sort specification for query results."""
 
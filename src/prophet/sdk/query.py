@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import inspect
+import re
+from collections.abc import Callable, Iterator
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import Any, cast
 
 
 class Operator(Enum):
@@ -22,6 +26,47 @@ class Operator(Enum):
     NWI = "nwi"
 
 
+# " eq ", " in ", ... per operator, so formatting a condition doesn't go through
+# the Enum `.value` descriptor and re-pad the operator every time.
+_PADDED_OPS = {op: f" {op.value} " for op in Operator}
+
+# Marks where a Q.compile() argument landed in the built PQL: "\x00<index>\x00" for a
+# scalar, "\x00<index>L\x00" for a list passed to in_().
+_SLOT_MARKER = re.compile("\x00(\\d+)(L?)\x00")
+
+
+def _format_value(value: Any) -> str:
+    """Format a value for PQL."""
+    if isinstance(value, str):
+        # Don't quote strings in PQL - the backend handles this. Passed through
+        # rather than str()'d so str-mixin Enum members render their value.
+        return value
+    return str(value)
+
+
+class _Slot:
+    """Stand-in for a Q.compile() argument while its template is traced."""
+
+    __slots__ = ("_index",)
+
+    def __init__(self, index: int) -> None:
+        self._index = index
+
+    def __str__(self) -> str:
+        return f"\x00{self._index}\x00"
+
+    def __iter__(self) -> Iterator[str]:
+        # in_() formats each element; the whole list becomes one marker
+        yield f"\x00{self._index}L\x00"
+
+    def _branch(self, *args: Any) -> Any:
+        # A template that tests or compares a parameter would bake one branch
+        # into the compiled PQL; fail tracing instead (see Q.compile).
+        raise TypeError("template parameters can't be tested or compared while tracing")
+
+    __bool__ = __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = __hash__ = _branch
+
+
 class Q:
     """
     Fluent PQL query builder.
@@ -41,6 +86,8 @@ class Q:
         Q.raw("dst.ip eq 10.90.8.53")
     """
 
+    __slots__ = ("_parts", "_pending_conjunction", "_pending_field", "_built")
+
     def __init__(self, field: str | None = None) -> None:
         """
         Create a new query builder.
@@ -51,6 +98,7 @@ class Q:
         self._parts: list[str] = []
         self._pending_conjunction: str | None = None
         self._pending_field: str | None = field
+        self._built: str | None = None
 
     @classmethod
     def group(cls, query: Q) -> Q:
@@ -82,6 +130,29 @@ class Q:
         instance._parts.append(pql)
         return instance
 
+    @staticmethod
+    def compile(template: Callable[..., Q]) -> Callable[..., str]:
+        """
+        Compile a query template into a function that renders its PQL directly.
+
+        `template` is called once with placeholders for its positional
+        parameters; from the traced PQL a function taking the same parameters is
+        generated that renders real values with a single f-string, skipping the
+        builder entirely. Use it for queries rebuilt many times with different
+        literals. Compiled templates are cached per callable.
+
+        The template may only pass its parameters straight to operator methods
+        (`.eq(port)`, `.in_(protos)`); converting, transforming or branching
+        on them (`int(port)`, `ip.strip()`, `Q.raw(pql)`, `if port:`) can't be
+        traced and raises ValueError. The generated function has the template's signature,
+        defaults included; *args/**kwargs parameters are rejected with ValueError.
+
+        Example:
+            by_host = Q.compile(lambda port, ip: Q("dst.port").eq(port).and_("src.ip").eq(ip))
+            by_host(443, "10.0.0.1")  # "dst.port eq 443 and src.ip eq 10.0.0.1"
+        """
+        return _compile(template)
+
     def _add_condition(self, field: str, op: Operator, value: Any) -> None:
         """Add a condition to the query."""
         # Add pending conjunction if any
@@ -92,114 +163,74 @@ class Q:
         # Format the condition
         condition = self._format_condition(field, op, value)
         self._parts.append(condition)
+        self._built = None
 
     def _format_condition(self, field: str, op: Operator, value: Any) -> str:
         """Format a single condition as PQL string."""
-        if op in (Operator.EX, Operator.NEX):
+        if op is Operator.EX or op is Operator.NEX:
             return f"{field} {op.value}"
 
-        if op == Operator.IN:
+        if op is Operator.IN:
             # Format list: field in [val1, val2, val3]
-            formatted_values = ", ".join(self._format_value(v) for v in value)
-            return f"{field} {op.value} [{formatted_values}]"
+            formatted_values = ", ".join(map(_format_value, value))
+            return f"{field}{_PADDED_OPS[op]}[{formatted_values}]"
 
-        return f"{field} {op.value} {self._format_value(value)}"
-
-    def _format_value(self, value: Any) -> str:
-        """Format a value for PQL."""
-        if isinstance(value, str):
-            # Don't quote strings in PQL - the backend handles this
-            return value
-        return str(value)
+        return f"{field}{_PADDED_OPS[op]}{_format_value(value)}"
 
     # Operator methods that use the pending field
-    def eq(self, value: str | int | float) -> Q:
-        """Equal to (field eq value)."""
+    def _apply(self, op: Operator, value: Any) -> Q:
+        """Apply `op` to the pending field (shared body of every operator method)."""
         if self._pending_field is None:
-            raise ValueError("No field specified. Use Q('field_name').eq(value)")
-        self._add_condition(self._pending_field, Operator.EQ, value)
+            raise ValueError(
+                "No field specified. Use Q('field_name') or and_/or_('field_name') first"
+            )
+        self._add_condition(self._pending_field, op, value)
         self._pending_field = None
         return self
 
+    def eq(self, value: str | int | float) -> Q:
+        """Equal to (field eq value)."""
+        return self._apply(Operator.EQ, value)
+
     def ne(self, value: str | int | float) -> Q:
         """Not equal to (field ne value)."""
-        if self._pending_field is None:
-            raise ValueError("No field specified")
-        self._add_condition(self._pending_field, Operator.NE, value)
-        self._pending_field = None
-        return self
+        return self._apply(Operator.NE, value)
 
     def gt(self, value: int | float) -> Q:
         """Greater than (field gt value)."""
-        if self._pending_field is None:
-            raise ValueError("No field specified")
-        self._add_condition(self._pending_field, Operator.GT, value)
-        self._pending_field = None
-        return self
+        return self._apply(Operator.GT, value)
 
     def lt(self, value: int | float) -> Q:
         """Less than (field lt value)."""
-        if self._pending_field is None:
-            raise ValueError("No field specified")
-        self._add_condition(self._pending_field, Operator.LT, value)
-        self._pending_field = None
-        return self
+        return self._apply(Operator.LT, value)
 
     def gte(self, value: int | float) -> Q:
         """Greater than or equal (field gte value)."""
-        if self._pending_field is None:
-            raise ValueError("No field specified")
-        self._add_condition(self._pending_field, Operator.GTE, value)
-        self._pending_field = None
-        return self
+        return self._apply(Operator.GTE, value)
 
     def lte(self, value: int | float) -> Q:
         """Less than or equal (field lte value)."""
-        if self._pending_field is None:
-            raise ValueError("No field specified")
-        self._add_condition(self._pending_field, Operator.LTE, value)
-        self._pending_field = None
-        return self
+        return self._apply(Operator.LTE, value)
 
     def exists(self) -> Q:
         """Field exists (field ex)."""
-        if self._pending_field is None:
-            raise ValueError("No field specified")
-        self._add_condition(self._pending_field, Operator.EX, None)
-        self._pending_field = None
-        return self
+        return self._apply(Operator.EX, None)
 
     def not_exists(self) -> Q:
         """Field does not exist (field nex)."""
-        if self._pending_field is None:
-            raise ValueError("No field specified")
-        self._add_condition(self._pending_field, Operator.NEX, None)
-        self._pending_field = None
-        return self
+        return self._apply(Operator.NEX, None)
 
     def in_(self, values: list[str | int]) -> Q:
         """Value in list (field in [val1, val2])."""
-        if self._pending_field is None:
-            raise ValueError("No field specified")
-        self._add_condition(self._pending_field, Operator.IN, values)
-        self._pending_field = None
-        return self
+        return self._apply(Operator.IN, values)
 
     def wildcard(self, pattern: str) -> Q:
         """Wildcard match (field wi pattern)."""
-        if self._pending_field is None:
-            raise ValueError("No field specified")
-        self._add_condition(self._pending_field, Operator.WI, pattern)
-        self._pending_field = None
-        return self
+        return self._apply(Operator.WI, pattern)
 
     def not_wildcard(self, pattern: str) -> Q:
         """Not wildcard match (field nwi pattern)."""
-        if self._pending_field is None:
-            raise ValueError("No field specified")
-        self._add_condition(self._pending_field, Operator.NWI, pattern)
-        self._pending_field = None
-        return self
+        return self._apply(Operator.NWI, pattern)
 
     # Conjunction methods
     def and_(self, field: str | None = None) -> Q:
@@ -246,6 +277,7 @@ class Q:
             self._parts.append(self._pending_conjunction)
             self._pending_conjunction = None
         self._parts.append(f"({query.build()})")
+        self._built = None
         return self
 
     def build(self) -> str:
@@ -255,7 +287,10 @@ class Q:
         Returns:
             Complete PQL query string
         """
-        return " ".join(self._parts)
+        # Cached until the next condition or group is added
+        if self._built is None:
+            self._built = " ".join(self._parts)
+        return self._built
 
     def is_empty(self) -> bool:
         """Check if query has no conditions."""
@@ -266,3 +301,73 @@ class Q:
 
     def __repr__(self) -> str:
         return f"Q({self.build()!r})"
+
+
+def _join_values(values: Any) -> str:
+    """An in_() list as rendered by a compiled template."""
+    return ", ".join(map(_format_value, values))
+
+
+@lru_cache(maxsize=128)
+def _compile(template: Callable[..., Q]) -> Callable[..., str]:
+    """Trace `template` with placeholders and generate a function returning its PQL."""
+    params = list(inspect.signature(template).parameters.values())
+    for param in params:
+        if param.kind is param.VAR_POSITIONAL or param.kind is param.VAR_KEYWORD:
+            raise ValueError(f"Query templates take named parameters only, not {param}")
+    names = [param.name for param in params]
+    args = [_Slot(i) for i, p in enumerate(params) if p.kind is not p.KEYWORD_ONLY]
+    kwargs = {p.name: _Slot(i) for i, p in enumerate(params) if p.kind is p.KEYWORD_ONLY}
+    try:
+        pql = template(*args, **kwargs).build()
+    except (TypeError, AttributeError) as e:
+        raise ValueError(
+            "Compiled query templates may only pass their parameters straight to "
+            f"operator methods (eq, in_, gt, ...); tracing failed with: {e}"
+        ) from e
+    pieces = _SLOT_MARKER.split(pql)
+
+    # The generated function takes the template's own parameter names; the
+    # closure's names get a prefix that none of them starts with.
+    prefix = "_pql_"
+    while any(name.startswith(prefix) for name in names):
+        prefix += "_"
+    spec: list[str] = []
+    for k, param in enumerate(params):
+        if param.kind is param.KEYWORD_ONLY and "*" not in spec:
+            spec.append("*")
+        spec.append(param.name)
+        if param.kind is param.POSITIONAL_ONLY and (
+            k + 1 == len(params) or params[k + 1].kind is not param.POSITIONAL_ONLY
+        ):
+            spec.append("/")
+
+    # split() yields literal, index, list-flag, literal, ...; literals are bound
+    # as closure cells rather than spliced into the source, so no field name or
+    # value from the template ever reaches exec()
+    texts = pieces[::3]
+    body = [f"{{{prefix}text0}}"]
+    for n, i in enumerate(range(1, len(pieces), 3), start=1):
+        name = names[int(pieces[i])]
+        helper = "join" if pieces[i + 1] else "fmt"
+        body.append(f"{{{prefix}{helper}({name})}}")
+        body.append(f"{{{prefix}text{n}}}")
+    cells = ", ".join(f"{prefix}text{n}" for n in range(len(texts)))
+    source = (
+        f"def _bind({prefix}fmt, {prefix}join, {cells}):\n"
+        f"    def compiled({', '.join(spec)}):\n"
+        f"        return f\"{''.join(body)}\"\n"
+        f"    return compiled\n"
+    )
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)  # source holds only identifiers, see above
+    compiled = namespace["_bind"](_format_value, _join_values, *texts)
+
+    # Defaults are attached as values, not written into the source
+    compiled.__defaults__ = tuple(
+        p.default for p in params if p.kind is not p.KEYWORD_ONLY and p.default is not p.empty
+    ) or None
+    compiled.__kwdefaults__ = {
+        p.name: p.default for p in params if p.kind is p.KEYWORD_ONLY and p.default is not p.empty
+    } or None
+    return cast(Callable[..., str], compiled)
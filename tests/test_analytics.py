@@ -0,0 +1,37 @@
+"""Tests for the column-oriented flow analytics helpers."""
+
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from prophet.sdk.flows.analytics import (
+    bytes_by_port,
+    count_by_cidr,
+    top_k_by_bytes,
+    u32_to_ipv4,
+)
+
+A, B, C = 0x0A000001, 0x0A000002, 0x0A000101  # 10.0.0.1, 10.0.0.2, 10.0.1.1
+
+
+def test_top_k_by_bytes_aggregates_and_ranks():
+    ips = array("I", [A, B, A, 0, C])
+    sizes = array("d", [100, 50, 100, 999, 10])
+    assert top_k_by_bytes(ips, sizes, k=2) == [(A, 200.0), (B, 50.0)]
+
+
+def test_bytes_by_port():
+    assert bytes_by_port([443, 53, 443], [1.0, 2.0, 3.0]) == {443: 4.0, 53: 2.0}
+
+
+def test_count_by_cidr():
+    counts = count_by_cidr(array("I", [A, B, C, 0]), prefix=24)
+    assert counts == {0x0A000000: 2, 0x0A000100: 1}
+    assert u32_to_ipv4(0x0A000100) == "10.0.1.0"
+
+
+def test_count_by_cidr_rejects_bad_prefix():
+    with pytest.raises(ValueError):
+        count_by_cidr([A], prefix=33)
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import responses
 
 from prophet.sdk import AuthenticationError, Prophet
-from tests.conftest import BASE_URL, TOKEN_URL, register_token
+from prophet.sdk.client import _SHARED
+from tests.conftest import BASE_URL, TOKEN_URL, make_jwt, register_token
 
 
 def test_default_base_url_is_production():
@@ -14,6 +20,29 @@ def test_default_base_url_is_production():
     assert p._base_url == "https://app.prophet.io"
 
 
+def test_namespaces_load_on_first_access():
+    code = (
+        "import sys; from prophet.sdk import Prophet; "
+        "p = Prophet(client_id='x', client_secret='y'); "
+        "assert 'prophet.sdk.flows.models' not in sys.modules; "
+        "p.flows; from prophet.sdk import Flow; "
+        "assert 'prophet.sdk.flows.models' in sys.modules; "
+        "assert 'prophet.sdk.deployments' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_subpackages_resolve_as_attributes():
+    code = (
+        "import prophet.sdk; "
+        "assert prophet.sdk.flows.FlowPage.__name__ == 'FlowPage'; "
+        "assert prophet.sdk.deployments.DeploymentsAPI; "
+        "assert prophet.sdk.collector.CollectorAPI; "
+        "assert {'flows', 'explore', 'profiles'} <= set(dir(prophet.sdk))"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_credentials_are_keyword_only():
     with pytest.raises(TypeError):
         Prophet("https://app.prophet.io", "cid", "secret")  # type: ignore[misc]
@@ -48,6 +77,13 @@ def test_bad_credentials_raise_authentication_error(prophet):
         _ = prophet.customer_id
 
 
+@responses.activate
+def test_non_json_401_raises_authentication_error(prophet):
+    responses.add(responses.POST, TOKEN_URL, body="<html>denied</html>", status=401)
+    with pytest.raises(AuthenticationError, match="Invalid credentials"):
+        _ = prophet.customer_id
+
+
 @responses.activate
 def test_retries_transient_5xx_then_succeeds():
     # Idempotent GET should retry past a 503 to a 200.
@@ -56,3 +92,78 @@ def test_retries_transient_5xx_then_succeeds():
     responses.add(responses.GET, f"{BASE_URL}/rest/nodes/1.0", status=503)
     responses.add(responses.GET, f"{BASE_URL}/rest/nodes/1.0", json={"nodes": []}, status=200)
     assert p.nodes.list() == []
+
+
+def test_session_mounts_pooled_adapter(prophet):
+    # One pooled adapter serves both schemes, sized past requests's default of 10.
+    https = prophet._session.get_adapter("https://x")
+    assert https is prophet._session.get_adapter("http://x")
+    assert https._pool_connections == 32
+    assert https._pool_maxsize == 64
+
+
+@responses.activate
+def test_concurrent_get_token_fetches_once(prophet):
+    register_token()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tokens = set(pool.map(lambda _: prophet._auth.get_token(), range(32)))
+    assert len(tokens) == 1
+    assert len([c for c in responses.calls if c.request.url == TOKEN_URL]) == 1
+
+
+@responses.activate
+def test_token_inside_refresh_threshold_is_refreshed(prophet):
+    # expires_at is within refresh_threshold (300s), so each access re-mints.
+    for _ in range(2):
+        responses.add(responses.POST, TOKEN_URL, status=200, json={
+            "access_token": make_jwt(), "expires_at": int(time.time()) + 60,
+        })
+    prophet._auth.get_token()
+    prophet._auth.get_token()
+    assert len([c for c in responses.calls if c.request.url == TOKEN_URL]) == 2
+
+
+@responses.activate
+def test_requests_carry_bearer_and_json_content_type(prophet):
+    register_token()
+    responses.add(responses.GET, f"{BASE_URL}/rest/nodes/1.0", json={"nodes": []}, status=200)
+    prophet.nodes.list()
+    sent = responses.calls[-1].request.headers
+    assert sent["Authorization"] == f"Bearer {prophet._auth.get_token()}"
+    assert sent["Content-Type"] == "application/json"
+    # The header string is built once per token, not per request.
+    assert prophet._auth.auth_header() is prophet._auth.auth_header()
+
+
+@responses.activate
+def test_share_session_reuses_session_and_token():
+    register_token()
+    kwargs = {"client_id": "shared", "client_secret": "s", "max_retries": 0}
+    a = Prophet(BASE_URL, share_session=True, **kwargs)
+    b = Prophet(BASE_URL, share_session=True, **kwargs)
+    c = Prophet(BASE_URL, **kwargs)
+    assert a._session is b._session and a._session is not c._session
+    a._auth.get_token()
+    b._auth.get_token()
+    assert sum(1 for call in responses.calls if call.request.url == TOKEN_URL) == 1
+
+    a.close()
+    a.close()  # idempotent; must not release b's hold twice
+    d = Prophet(BASE_URL, share_session=True, **kwargs)
+    assert d._session is b._session
+    b.close()
+    d.close()
+    assert not _SHARED
+
+
+@responses.activate
+def test_json_bodies_use_stdlib_encoding_and_headers_are_copied(prophet):
+    register_token()
+    responses.add(responses.POST, f"{BASE_URL}/echo", json={}, status=200)
+    headers = {"X-Trace": "1"}
+
+    prophet._request("POST", "/echo", json={1: "a", "big": 2**64}, headers=headers)
+
+    assert responses.calls[-1].request.body == b'{"1": "a", "big": 18446744073709551616}'
+    assert responses.calls[-1].request.headers["X-Trace"] == "1"
+    assert headers == {"X-Trace": "1"}
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 import responses
 
-from prophet.sdk import Deployment, ValidationError
+from prophet.sdk import APIError, Deployment, ValidationError
 from tests.conftest import BASE_URL, register_token
 
 DEPLOYMENTS_URL = f"{BASE_URL}/rest/deployments/1.0"
@@ -72,14 +72,47 @@ def test_get_finds_by_customer_id(prophet):
         status=200,
     )
     assert prophet.deployments.get("child-1").customer_id == "child-1"
-    # second list call for the miss
+    # the miss is answered from the cached list, without a second request
+    assert prophet.deployments.get("nope") is None
+    assert sum(1 for c in responses.calls if c.request.url.startswith(DEPLOYMENTS_URL)) == 1
+
+
+@responses.activate
+def test_create_invalidates_cached_list(prophet):
+    register_token(aud="test-parent")
+    listing = {"deployments": [{"customer_id": "child-1"}]}
+    responses.add(responses.GET, DEPLOYMENTS_URL, json=listing, status=200)
+    assert prophet.deployments.get("child-2") is None
     responses.add(
-        responses.GET,
-        DEPLOYMENTS_URL,
-        json={"deployments": [{"customer_id": "child-1", "name": "C1"}], "count": 1},
-        status=200,
+        responses.POST, DEPLOYMENTS_URL, status=201,
+        json={"deployment": {"customer": {"customer_id": "child-2"}}},
     )
-    assert prophet.deployments.get("nope") is None
+    prophet.deployments.create(name="Two", handle="two")
+    responses.replace(
+        responses.GET, DEPLOYMENTS_URL, status=200,
+        json={"deployments": [{"customer_id": "child-1"}, {"customer_id": "child-2"}]},
+    )
+    assert prophet.deployments.get("child-2").customer_id == "child-2"
+
+
+@responses.activate
+def test_mutating_list_result_does_not_touch_cache(prophet):
+    register_token()
+    listing = {"deployments": [{"customer_id": "c1"}]}
+    responses.add(responses.GET, DEPLOYMENTS_URL, json=listing, status=200)
+    prophet.deployments.list().clear()
+    assert prophet.deployments.get("c1").customer_id == "c1"
+    assert sum(1 for c in responses.calls if c.request.url.startswith(DEPLOYMENTS_URL)) == 1
+
+
+@responses.activate
+def test_list_cache_is_bounded(prophet, monkeypatch):
+    monkeypatch.setattr("prophet.sdk.deployments.api._LIST_CACHE_SIZE", 2)
+    register_token()
+    responses.add(responses.GET, DEPLOYMENTS_URL, json={"deployments": []}, status=200)
+    for parent in ("p1", "p2", "p1", "p3"):
+        prophet.deployments.get("x", parent_id=parent)
+    assert list(prophet.deployments._list_cache) == ["p1", "p3"]  # p2 least recently used
 
 
 def test_create_requires_name_and_handle(prophet):
@@ -87,3 +120,27 @@ def test_create_requires_name_and_handle(prophet):
         prophet.deployments.create(name="", handle="x")
     with pytest.raises(ValidationError):
         prophet.deployments.create(name="x", handle="")
+
+
+@responses.activate
+def test_list_invalid_json_raises_api_error(prophet):
+    register_token()
+    responses.add(responses.GET, DEPLOYMENTS_URL, body="<html>bad gateway</html>", status=200)
+    with pytest.raises(APIError, match="Invalid JSON response"):
+        prophet.deployments.list()
+
+
+@responses.activate
+def test_get_many_uses_one_list_call(prophet):
+    register_token()
+    responses.add(
+        responses.GET,
+        DEPLOYMENTS_URL,
+        json={"deployments": [{"customer_id": "child-1"}, {"customer_id": "child-2"}]},
+        status=200,
+    )
+    found = prophet.deployments.get_many(["child-2", "missing", "child-2"])
+    assert list(found) == ["child-2", "missing"]
+    assert found["child-2"].customer_id == "child-2"
+    assert found["missing"] is None
+    assert sum(1 for c in responses.calls if c.request.url.startswith(DEPLOYMENTS_URL)) == 1
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from prophet.sdk import APIError, AuthenticationError, ValidationError
-from prophet.sdk.exceptions import raise_for_response
+from prophet.sdk.exceptions import ERROR_HANDLERS, raise_for_response
 
 
 class FakeResponse:
@@ -35,6 +35,16 @@ def test_400_maps_to_validation_error():
         raise_for_response(FakeResponse(400, {"error": "missing field"}))
 
 
+def test_handlers_override_single_status():
+    handlers = {**ERROR_HANDLERS, 400: lambda status, msg, kind, det: APIError(msg, status)}
+    with pytest.raises(APIError) as exc:
+        raise_for_response(FakeResponse(400, {"error": "bad query"}), handlers)
+    assert exc.value.status_code == 400
+    assert exc.value.message == "bad query"
+    with pytest.raises(AuthenticationError):
+        raise_for_response(FakeResponse(401, {}), handlers)
+
+
 @pytest.mark.parametrize("status", [403, 404, 500, 502])
 def test_other_errors_map_to_apierror_with_status(status):
     with pytest.raises(APIError) as exc:
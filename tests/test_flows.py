@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
 import json
 
 import pytest
 import responses
 
-from prophet.sdk import APIError, AuthenticationError, Q
+from prophet.sdk import APIError, AuthenticationError, HoursAgo, Q, Sort
 from tests.conftest import BASE_URL, register_token
 
 SEARCH_URL = f"{BASE_URL}/search/records/1.0"
@@ -167,3 +169,258 @@ def test_search_400_nested_envelope(prophet):
     assert exc.value.error_type == "validation_error"
     assert exc.value.message == "PQL parse failure near 'eqq'"
     assert exc.value.details == {"position": 17}
+
+
+# --- background prefetch -------------------------------------------------------
+
+@responses.activate
+def test_prefetch_spans_pages(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=True), status=200)
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=True), status=200)
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+    with prophet.flows.query(INSTANCE, prefetch=True) as it:
+        flows = list(it)
+    assert len(flows) == 5
+    pages = [json.loads(c.request.body)["page"] for c in responses.calls
+             if c.request.url == SEARCH_URL]
+    assert pages == [0, 1, 2]
+
+
+@responses.activate
+def test_prefetch_skipped_when_limit_met_by_current_page(prophet):
+    register_token()
+    # Only page 0 is registered; a prefetch of page 1 would be an unfired mock error.
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=True), status=200)
+    flows = prophet.flows.query(INSTANCE, prefetch=True).collect(limit=2)
+    assert len(flows) == 2
+    assert len([c for c in responses.calls if c.request.url == SEARCH_URL]) == 1
+
+
+# --- async iteration ---------------------------------------------------------
+
+@responses.activate
+def test_aquery_spans_pages(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=True), status=200)
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+
+    async def run():
+        return [f async for f in prophet.flows.aquery(INSTANCE)]
+
+    assert len(asyncio.run(run())) == 3
+
+
+@responses.activate
+def test_aquery_collect_limit_stops_early(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=True), status=200)
+    flows = asyncio.run(prophet.flows.aquery(INSTANCE).collect(limit=2))
+    assert len(flows) == 2
+    assert len([c for c in responses.calls if c.request.url == SEARCH_URL]) == 1
+
+
+@responses.activate
+def test_aquery_stops_after_aclose(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(3, more=False), status=200)
+
+    async def run():
+        flows = prophet.flows.aquery(INSTANCE)
+        first = await flows.__anext__()
+        await flows.aclose()
+        return [first] + [f async for f in flows]
+
+    assert len(asyncio.run(run())) == 1
+
+
+@responses.activate
+def test_aquery_failed_page_is_not_reawaited(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json={"error": "boom"}, status=500)
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+
+    async def run():
+        flows = prophet.flows.aquery(INSTANCE)
+        with pytest.raises(APIError):
+            await flows.__anext__()
+        return [f async for f in flows]
+
+    assert len(asyncio.run(run())) == 1
+
+
+@responses.activate
+def test_aquery_passes_rate_limit_retries(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, status=429)
+    with pytest.raises(APIError) as exc:
+        asyncio.run(prophet.flows.aquery(INSTANCE, rate_limit_retries=0).collect())
+    assert exc.value.status_code == 429
+    assert sum(1 for c in responses.calls if c.request.url == SEARCH_URL) == 1
+
+
+@responses.activate
+def test_request_body_fields_and_page_numbers(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=True), status=200)
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+    list(prophet.flows.query(INSTANCE, query=Q("dst.port").eq(443), start=HoursAgo(1),
+                             sort=[Sort("bytes")], fields=["src.ip"], size=50))
+    bodies = [json.loads(c.request.body) for c in responses.calls if c.request.url == SEARCH_URL]
+    assert [b["page"] for b in bodies] == [0, 1]
+    assert bodies[0] == {
+        "instance_ids": [INSTANCE],
+        "module": "flows",
+        "sentence": "dst.port eq 443",
+        "start": {"relative": {"value": 1, "unit": "hours"}},
+        "sort": [{"field": "bytes", "order": "desc"}],
+        "fields": ["src.ip"],
+        "size": 50,
+        "page": 0,
+    }
+
+
+@responses.activate
+def test_gzip_page_is_negotiated_and_decoded(prophet):
+    register_token()
+    responses.add(
+        responses.POST, SEARCH_URL,
+        body=gzip.compress(json.dumps(_page(2, more=False)).encode()),
+        headers={"Content-Encoding": "gzip"},
+        content_type="application/json",
+    )
+    flows = prophet.flows.query(INSTANCE).collect()
+    assert len(flows) == 2
+    assert "gzip" in responses.calls[-1].request.headers["Accept-Encoding"]
+
+
+@responses.activate
+def test_batches_yield_pages_trimmed_to_take(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=True), status=200)
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=True), status=200)
+    pages = list(prophet.flows.query(INSTANCE).take(3).batches())
+    assert [len(p.flows) for p in pages] == [2, 1]
+
+
+@responses.activate
+def test_record_batches_yield_columns(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=True), status=200)
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+    batches = list(prophet.flows.query(INSTANCE, prefetch=True).record_batches())
+    assert [len(b) for b in batches] == [2, 1]
+    assert list(batches[0].dst_port) == [443, 443]
+
+
+@responses.activate
+def test_select_sends_fields_and_locks_after_start(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+    it = prophet.flows.query(INSTANCE).select("src.ip", "dst.port")
+    assert [f.src.ip for f in it] == ["1.1.1.1"]
+    assert json.loads(responses.calls[-1].request.body)["fields"] == ["src.ip", "dst.port"]
+    with pytest.raises(ValueError, match="before iteration"):
+        it.select("bytes")
+
+
+@responses.activate
+def test_auto_size_follows_limit_and_stays_fixed(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=False), status=200)
+    prophet.flows.query(INSTANCE, size="auto").collect(limit=30)
+    assert json.loads(responses.calls[-1].request.body)["size"] == 30
+
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=True), status=200)
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+    list(prophet.flows.query(INSTANCE, size="auto"))
+    sizes = [json.loads(c.request.body)["size"] for c in responses.calls[-2:]]
+    assert sizes[0] == sizes[1] > 100
+
+
+@responses.activate
+def test_collect_many_scans_each_instance(prophet):
+    register_token()
+
+    def reply(request):
+        instance = json.loads(request.body)["instance_ids"][0]
+        page = {"flows": [{"src": {"ip": instance}}], "more_data_available": False}
+        return 200, {}, json.dumps({instance: page})
+
+    responses.add_callback(responses.POST, SEARCH_URL, callback=reply)
+    results = prophet.flows.collect_many(["inst-1", "inst-2", "inst-3"], max_workers=2)
+    assert list(results) == ["inst-1", "inst-2", "inst-3"]
+    assert {i: [f.src.ip for f in flows] for i, flows in results.items()} == {
+        "inst-1": ["inst-1"], "inst-2": ["inst-2"], "inst-3": ["inst-3"],
+    }
+
+
+@responses.activate
+def test_reused_q_renders_once_and_tracks_changes(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+    q = Q("dst.port").eq(443)
+    first = prophet.flows.query(INSTANCE, query=q)
+    second = prophet.flows.query("inst-2", query=q)
+    assert first._query is second._query  # cached build() string, not re-rendered
+    q.and_("bytes").gt(10)
+    list(prophet.flows.query(INSTANCE, query=q))
+    sentence = json.loads(responses.calls[-1].request.body)["sentence"]
+    assert sentence == "dst.port eq 443 and bytes gt 10"
+
+
+@responses.activate
+def test_take_smaller_than_page_shrinks_request_size(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=True), status=200)
+    responses.add(responses.POST, SEARCH_URL, json=_page(2, more=True), status=200)
+    flows = prophet.flows.query(INSTANCE, size=1000).take(3).collect()
+    assert len(flows) == 3
+    bodies = [json.loads(c.request.body) for c in responses.calls if c.request.url == SEARCH_URL]
+    assert [(b["size"], b["page"]) for b in bodies] == [(3, 0), (3, 1)]
+
+
+@responses.activate
+def test_exhausted_iterator_stays_exhausted(prophet):
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+    it = prophet.flows.query(INSTANCE)
+    assert len(list(it)) == 1
+    calls = len(responses.calls)
+    with pytest.raises(StopIteration):
+        next(it)
+    assert len(responses.calls) == calls
+
+
+@responses.activate
+def test_rate_limited_page_is_retried_after_retry_after(prophet, monkeypatch):
+    slept = []
+    monkeypatch.setattr("prophet.sdk.flows.iterator.time.sleep", slept.append)
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, status=429, headers={"Retry-After": "2"})
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+    assert len(prophet.flows.query(INSTANCE).collect()) == 1
+    assert len(slept) == 1 and 2.0 <= slept[0] <= 2.5
+
+
+@pytest.mark.parametrize("retry_after", ["nan", "inf", "Wed, 21 Oct 2015 07:28:00 GMT"])
+@responses.activate
+def test_unusable_retry_after_falls_back_to_backoff(prophet, monkeypatch, retry_after):
+    slept = []
+    monkeypatch.setattr("prophet.sdk.flows.iterator.time.sleep", slept.append)
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, status=429, headers={"Retry-After": retry_after})
+    responses.add(responses.POST, SEARCH_URL, json=_page(1, more=False), status=200)
+    assert len(prophet.flows.query(INSTANCE).collect()) == 1
+    assert len(slept) == 1 and 0.5 <= slept[0] <= 0.625
+
+
+@responses.activate
+def test_rate_limit_gives_up_after_retries(prophet, monkeypatch):
+    monkeypatch.setattr("prophet.sdk.flows.iterator.time.sleep", lambda s: None)
+    register_token()
+    responses.add(responses.POST, SEARCH_URL, status=429)
+    with pytest.raises(APIError) as exc:
+        prophet.flows.query(INSTANCE, rate_limit_retries=1).collect()
+    assert exc.value.status_code == 429
+    assert sum(1 for c in responses.calls if c.request.url == SEARCH_URL) == 2
@@ -0,0 +1,14 @@
+"""Tests for the JSON encode/decode helpers."""
+
+from __future__ import annotations
+
+from prophet.sdk import _json
+
+
+def test_dumps_returns_compact_bytes():
+    assert _json.dumps({"a": [1, 2], "b": None}) == b'{"a":[1,2],"b":null}'
+
+
+def test_loads_accepts_bytes_and_text():
+    assert _json.loads(b'{"x": 1}') == {"x": 1}
+    assert _json.loads('{"x": 1}') == {"x": 1}
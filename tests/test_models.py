@@ -1,14 +1,18 @@
 """Tests for data models."""
 
+import dataclasses
+import pickle
 from datetime import datetime
 
 import pytest
+from pydantic import ValidationError as PydanticValidationError
 
 from prophet.sdk import (
     At,
     DaysAgo,
     DirectionFields,
     Flow,
+    FlowList,
     FlowPage,
     HoursAgo,
     MinutesAgo,
@@ -16,6 +20,7 @@ from prophet.sdk import (
     Sort,
     WeeksAgo,
 )
+from prophet.sdk.flows.models import _PageBody
 
 
 class TestTimeFilters:
@@ -192,6 +197,12 @@ class TestFlow:
         }
         flow = Flow.model_validate(data)
         assert flow.id == "test"
+        assert flow.model_extra == {"unknown_field": "value", "another_unknown": {"nested": "data"}}
+
+    def test_nested_leaf_models_drop_unknown_fields(self):
+        flow = Flow.model_validate({"src": {"ip": "1.1.1.1", "new_thing": 1}})
+        assert flow.src.ip == "1.1.1.1"
+        assert flow.src.model_extra is None
 
 
 class TestFlowPage:
@@ -224,3 +235,162 @@ class TestFlowPage:
         assert page.has_more is True
         assert page.took == 0.15
         assert page.instance_id == "instance-1"
+
+    def test_from_json(self):
+        body = (
+            b'{"instance-1": {"flows": [{"id": "1", "metric": {"total_bytes": 100}}],'
+            b' "found": 7, "pages": 3, "more_data_available": true, "took": 0.2},'
+            b' "other": {"flows": [{"id": "x"}]}, "took": 0.3}'
+        )
+        page = FlowPage.from_json(body, "instance-1")
+
+        assert [f.id for f in page.flows] == ["1"]
+        assert page.flows[0].bytes == 100
+        assert page.found == 7
+        assert page.returned == 1
+        assert page.page_count == 3
+        assert page.has_more is True
+        assert page.instance_id == "instance-1"
+
+    def test_from_json_missing_instance_is_empty(self):
+        page = FlowPage.from_json(b"{}", "instance-1")
+        assert page.flows == []
+        assert page.has_more is False
+
+    @pytest.mark.parametrize("n", [1, 100, 10_000])
+    def test_from_json_scale(self, n):
+        rows = ",".join(
+            f'{{"id": "{i}", "dst": {{"port": {i % 3}}}, "metric": {{"total_bytes": {i}}}}}'
+            for i in range(n)
+        )
+        page = FlowPage.from_json(f'{{"x": {{"flows": [{rows}], "returned": {n}}}}}', "x")
+
+        assert len(page.flows) == page.returned == n
+        cols = page.to_arrays()
+        assert len(cols) == n
+        assert sum(cols.bytes) == n * (n - 1) / 2
+        assert len(page.where(dst_port=0)) == (n + 2) // 3
+        assert [f.id for f in page.flows] == [str(i) for i in range(n)]
+
+    def test_rows_validated_lazily(self):
+        # A malformed row only fails when it is actually read.
+        data = {"flows": [{"id": "1"}, {"src": "not-an-object"}], "found": 2}
+        page = FlowPage.from_response(data, "instance-1")
+
+        assert len(page.flows) == 2
+        assert page.flows[0].id == "1"
+        assert page.flows[0] is page.flows[0]  # cached after first access
+        with pytest.raises(PydanticValidationError):
+            page.flows[1]
+
+    def test_to_arrays(self):
+        data = {"flows": [
+            {"@timestamp": 1706000000000, "app_name": "DNS",
+             "src": {"ip": "192.168.1.1", "port": 54321}, "dst": {"ip": "10.0.0.1", "port": 53},
+             "metric": {"total_bytes": 512}},
+            {"src": {"ip": "::1"}, "stats": {"volume": {"bytes": {"total": 64}}}},
+        ]}
+        page = FlowPage.from_response(data, "instance-1")
+        page.flows[1]  # mix of materialized and raw rows
+        cols = page.to_arrays()
+
+        assert len(cols) == 2
+        assert list(cols.src_ip) == [0xC0A80101, 0]  # IPv6 -> 0
+        assert list(cols.dst_ip) == [0x0A000001, 0]
+        assert list(cols.src_port) == [54321, 0]
+        assert list(cols.dst_port) == [53, 0]
+        assert list(cols.bytes) == [512.0, 64.0]
+        assert list(cols.timestamp) == [1706000000000, 0]
+        assert cols.app_name == ["DNS", None]
+        assert cols.dst_port.typecode == "H"
+
+    def test_to_arrays_coerces_loose_rows(self):
+        rows = [
+            {"@timestamp": "1706000000000", "src": {"ip": "10.0.0.1", "port": "80"},
+             "dst": {"port": 443.0}, "metric": {"total_bytes": "512"}},
+            {"@timestamp": 1706000000000.0, "src": {"ip": ["bogus"], "port": 70000},
+             "dst": "not-an-object", "stats": {"volume": {"bytes": {"total": "x"}}}},
+            {"@timestamp": "2024-01-23T10:00:00Z"},
+        ]
+        page = FlowPage.from_response({"flows": rows}, "instance-1")
+        assert page.flows[0].src_port == 80  # Flow accepts the same row
+        cols = page.to_arrays()
+
+        assert list(cols.timestamp) == [1706000000000, 1706000000000, 0]
+        assert list(cols.src_ip) == [0x0A000001, 0, 0]
+        assert list(cols.src_port) == [80, 0, 0]  # out of uint16 range -> 0
+        assert list(cols.dst_port) == [443, 0, 0]
+        assert list(cols.bytes) == [512.0, 0.0, 0.0]
+        assert [f.id for f in page.where(src_port=80)] == [None]
+
+    def test_where(self):
+        data = {"flows": [
+            {"id": "a", "src": {"ip": "10.0.0.1"}, "dst": {"port": 443}},
+            {"id": "b", "src": {"ip": "10.0.0.2"}, "dst": {"port": 443}},
+            {"id": "c", "src": {"ip": "10.0.0.1"}, "dst": {"port": 53}},
+        ]}
+        page = FlowPage.from_response(data, "instance-1")
+
+        assert [f.id for f in page.where(dst_port=443)] == ["a", "b"]
+        assert [f.id for f in page.where(dst_port=443, src_ip="10.0.0.1")] == ["a"]
+        assert len(page.where()) == 3
+        with pytest.raises(ValueError, match="Unknown column"):
+            page.where(port=443)
+
+    @pytest.mark.parametrize("ip", ["2001:db8::5", "10.0.0.300", ""])
+    def test_where_rejects_non_ipv4_filter(self, ip):
+        data = {"flows": [{"id": "a", "src": {"ip": "fe80::1"}}, {"id": "b"}]}
+        page = FlowPage.from_response(data, "instance-1")
+        with pytest.raises(ValueError, match="not an IPv4 address"):
+            page.where(src_ip=ip)
+
+    def test_where_reads_only_named_columns(self, monkeypatch):
+        page = FlowPage.from_response({"flows": [{"dst": {"port": 443}}]}, "instance-1")
+        read = []
+        column = FlowList._column
+
+        def spy(self, name):
+            read.append(name)
+            return column(self, name)
+
+        monkeypatch.setattr(FlowList, "_column", spy)
+
+        assert len(page.where(dst_port=443).where(dst_port=443)) == 1
+        assert read == ["dst_port", "dst_port"]
+
+
+def test_page_body_keeps_parsed_rows():
+    parsed = {"flows": [{"id": "1"}], "found": 1}
+    assert _PageBody.model_validate(parsed).flows[0] is parsed["flows"][0]  # not copied
+
+
+def test_from_json_shares_repeated_strings():
+    content = (
+        b'{"inst": {"flows": [{"app_name": "ssl", "src": {"address_type": "private"}},'
+        b' {"app_name": "ssl", "src": {"address_type": "private"}}]}}'
+    )
+    flows = FlowPage.from_json(content, "inst").flows
+    assert flows[0].app_name is flows[1].app_name
+    assert flows[0].src.address_type is flows[1].src.address_type
+
+
+def test_time_filter_dicts_are_fresh():
+    d = Now().to_dict()
+    d["x"] = 1
+    assert Now().to_dict() == {"now": True}
+    t = HoursAgo(3)
+    assert t.to_dict() is not t.to_dict()
+    assert dataclasses.asdict(t) == {"value": 3}
+    assert dataclasses.asdict(Sort("bytes")) == {"field": "bytes", "order": "desc"}
+    assert t == HoursAgo(3) and hash(t) == hash(HoursAgo(3))
+    assert repr(t) == "HoursAgo(value=3)"
+    assert not hasattr(t, "__dict__") and not hasattr(Sort("bytes"), "__dict__")
+
+
+@pytest.mark.parametrize(
+    "value", [Now(), HoursAgo(3), WeeksAgo(1), At("2025-01-15T00:00:00Z"), Sort("bytes", "asc")]
+)
+def test_slotted_filters_pickle_round_trip(value):
+    restored = pickle.loads(pickle.dumps(value))
+    assert restored == value
+    assert restored.to_dict() == value.to_dict()
@@ -1,5 +1,7 @@
 """Tests for PQL query builder."""
 
+from enum import Enum
+
 import pytest
 
 from prophet.sdk import Q
@@ -133,6 +135,14 @@ class TestQStringConversion:
         q = Q("dst.port").eq(443)
         assert not q.is_empty()
 
+    def test_build_cached_until_extended(self):
+        q = Q("dst.port").eq(443)
+        assert q.build() is q.build()
+        q.and_("bytes").gt(1000)
+        assert q.build() == "dst.port eq 443 and bytes gt 1000"
+        q.and_().add_group(Q("protocol").eq("tcp"))
+        assert q.build() == "dst.port eq 443 and bytes gt 1000 and (protocol eq tcp)"
+
 
 class TestQValidation:
     """Test query validation."""
@@ -140,3 +150,90 @@ class TestQValidation:
     def test_no_field_raises(self):
         with pytest.raises(ValueError, match="No field specified"):
             Q().eq(443)
+
+
+class TestQCompile:
+    """Test compiled query templates."""
+
+    def test_matches_builder(self):
+        def template(port, ip):
+            return Q("dst.port").eq(port).and_("src.ip").eq(ip)
+
+        compiled = Q.compile(template)
+        assert compiled(443, "10.0.0.1") == template(443, "10.0.0.1").build()
+        assert compiled(53, "{x}") == "dst.port eq 53 and src.ip eq {x}"
+
+    def test_in_and_groups(self):
+        compiled = Q.compile(
+            lambda protos, port: Q.group(Q("protocol").in_(protos)).and_("dst.port").gte(port)
+        )
+        assert compiled(["tcp", "udp"], 1024) == "(protocol in [tcp, udp]) and dst.port gte 1024"
+
+    def test_cached_per_template(self):
+        def template(port):
+            return Q("dst.port").eq(port)
+
+        assert Q.compile(template) is Q.compile(template)
+
+    def test_wrong_arity_raises(self):
+        compiled = Q.compile(lambda port: Q("dst.port").eq(port))
+        with pytest.raises(TypeError):
+            compiled(1, 2)
+
+    def test_keyword_arguments(self):
+        compiled = Q.compile(lambda port, ip: Q("dst.port").eq(port).and_("src.ip").eq(ip))
+        assert compiled(ip="10.0.0.1", port=443) == "dst.port eq 443 and src.ip eq 10.0.0.1"
+
+    def test_parameter_names_cannot_collide_with_internals(self):
+        compiled = Q.compile(lambda _pql_text0: Q("dst.port").eq(_pql_text0))
+        assert compiled("443") == "dst.port eq 443"
+
+    def test_defaults_and_keyword_only_parameters(self):
+        def template(port, /, app="ssh", *, protos, min_bytes=0):
+            return (
+                Q("dst.port").eq(port).and_("app_name").eq(app)
+                .and_("protocol").in_(protos).and_("bytes").gt(min_bytes)
+            )
+
+        compiled = Q.compile(template)
+        assert compiled(22, protos=["tcp"]) == template(22, protos=["tcp"]).build()
+        assert compiled(1, "dns", protos=["udp"], min_bytes=5) == (
+            "dst.port eq 1 and app_name eq dns and protocol in [udp] and bytes gt 5"
+        )
+
+    def test_variadic_parameters_rejected(self):
+        with pytest.raises(ValueError, match="named parameters only"):
+            Q.compile(lambda *ports: Q("dst.port").in_(ports))
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            lambda pql: Q.raw(pql),
+            lambda port: Q("dst.port").eq(int(port)),
+            lambda ip: Q("src.ip").eq(ip.strip()),
+            lambda port: Q("a").eq(1).and_("b").eq(port) if port else Q("a").eq(1),
+            lambda port: Q("a").eq(80 if port == 443 else port),
+        ],
+    )
+    def test_untraceable_templates_rejected(self, template):
+        with pytest.raises(ValueError, match="straight to operator methods"):
+            Q.compile(template)
+
+
+class TestQEnumValues:
+    """str-mixin Enum members render as their value, not their name."""
+
+    class Proto(str, Enum):
+        TCP = "tcp"
+        UDP = "udp"
+
+    def test_in_list(self):
+        query = Q("protocol").in_([self.Proto.TCP, self.Proto.UDP]).build()
+        assert query == "protocol in [tcp, udp]"
+
+    def test_compiled_matches_builder(self):
+        def template(protos, proto):
+            return Q("protocol").in_(protos).and_("transport.proto").eq(proto)
+
+        args = ([self.Proto.TCP], self.Proto.UDP)
+        assert Q.compile(template)(*args) == template(*args).build()